@@ -90,10 +90,8 @@ class VehicleFactory(Configurable):
 
     def _assign_new_vin(self) -> int:
         """Return the latest VIN for assignment to a newly created vehicle."""
-        # TODO: not thread-safe. must be changed for multiprocessing.
-        vin = SHARED.vin_counter
-        SHARED.vin_counter += 1
-        return vin
+        # TODO: not process-safe. must be changed for multiprocessing.
+        return SHARED.next_vin()
 
     def pick_destination(self) -> int:
         """Randomly choose a destination."""
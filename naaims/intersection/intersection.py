@@ -314,13 +314,14 @@ class Intersection(Configurable, Facility, Upstream, Downstream):
     def stopping_distance_to_last_vehicle(self, start_coord: Coord
                                           ) -> Optional[float]:
         """Return the closest vehicle on a lane that starts at this coord."""
-        sds: List[float] = []
-        for lane in self.lanes_by_start[start_coord]:
-            sd = lane.stopping_distance_to_last_vehicle()
-            if sd is not None:
-                sds.append(sd)
-
         # Return the smallest stopping distance among all the IntersectionLanes
         # starting at this Coord. If none of them have a stopping distance
         # (i.e., none of them have vehicles on them), return None.
-        return min(sds) if len(sds) > 0 else None
+        closest: Optional[float] = None
+        for lane in self.lanes_by_start[start_coord]:
+            if not lane.vehicles:
+                continue
+            sd = lane.stopping_distance_to_last_vehicle()
+            if (sd is not None) and ((closest is None) or (sd < closest)):
+                closest = sd
+        return closest
@@ -70,15 +70,16 @@ class IntersectionLane(Lane):
     def controls_this_speed(self, vehicle: Vehicle) -> Tuple[bool, float,
                                                              VehicleSection]:
         """Return the vehicle's controlling section and progress."""
-        front = self.vehicle_progress[vehicle].front
+        progress = self.vehicle_progress[vehicle]
+        front = progress.front
         if front is not None:
             # Front of the vehicle is in the lane.
             return True, front, VehicleSection.FRONT
-        rear = self.vehicle_progress[vehicle].rear
+        rear = progress.rear
         if rear is not None:
             # Surely the rear of the vehicle must be in the lane.
             return True, rear, VehicleSection.REAR
-        center = self.vehicle_progress[vehicle].center
+        center = progress.center
         if center is None:
             raise RuntimeError("Vehicle exited lane already.")
         return True, center, VehicleSection.CENTER
@@ -96,7 +97,8 @@ class IntersectionLane(Lane):
         #       See the get_new_speeds todo for more information.
 
     def accel_update(self, vehicle: Vehicle, section: VehicleSection, p: float,
-                     preceding: Optional[Vehicle]) -> float:
+                     preceding: Optional[Vehicle],
+                     effective_speed_limit: Optional[float] = None) -> float:
         """Return a vehicle's new acceleration.
 
         NAAIMS assumes that, in an intersection, vehicles will always move as
@@ -117,8 +119,10 @@ class IntersectionLane(Lane):
                 return a
         if vehicle.trailing:
             # Trailing vehicles in a sequence observe following behavior.
-            return super().accel_update(vehicle, section, p, preceding)
-        return super().accel_update_uncontested(vehicle, p)
+            return super().accel_update(vehicle, section, p, preceding,
+                                        effective_speed_limit)
+        return super().accel_update_uncontested(vehicle, p,
+                                                effective_speed_limit)
 
         # TODO: (stochasticity+) Change so speed and acceleration can be
         # affected by the extent and location of its lateral deviation.
@@ -190,14 +194,13 @@ class IntersectionLane(Lane):
         # the fixed buffer lengths before and after it.
         if front_exit.section is not VehicleSection.FRONT:
             raise ValueError('Not a front exit.')
-        x = front_exit.vehicle.length * \
-            (1 + 2*SHARED.SETTINGS.length_buffer_factor)
-        if self.trajectory.length < x:
+        x = front_exit.vehicle.length_buffered
+        if self.trajectory_length < x:
             raise RuntimeError("Vehicle (plus buffer) longer than lane.")
         if entire_lane:
             # From front entrance to rear exit is two car lengths plus the
             # length of the entire intersection lane.
-            x += x + self.trajectory.length
+            x += x + self.trajectory_length
         a = SHARED.SETTINGS.min_acceleration
         v0 = front_exit.velocity
         v_full_accel = sqrt(v0**2 + 2*a*x)
@@ -63,5 +63,11 @@ class Reservation:
     dependency: Optional[Reservation] = None
     predecessors: FrozenSet[Reservation] = frozenset()
 
+    def __post_init__(self) -> None:
+        # Reservations key the potential and confirmed reservation dicts on
+        # every tile they touch, so cache the hash instead of recomputing it
+        # through the vehicle on every lookup.
+        self.__hash = hash(self.vehicle)
+
     def __hash__(self) -> int:
-        return hash(self.vehicle)
+        return self.__hash
@@ -6,7 +6,7 @@ from warnings import warn
 import naaims.shared as SHARED
 from naaims.util import Coord, CollisionError
 from naaims.intersection.tilings.tiling import Tiling
-from naaims.intersection.tilings.tiles import DeterministicTile
+from naaims.intersection.tilings.tiles import DeterministicTile, TileLayer
 
 if TYPE_CHECKING:
     from naaims.road import RoadLane
@@ -77,6 +77,12 @@ class SquareTiling(Tiling):
         # be flipped to match normal coordinate schemas.
         self.origin = Coord(self.min_x, self.min_y)
 
+        # Precompute the tile range covering the entire grid, used in place of
+        # a vehicle's footprint when every tile needs to be checked.
+        self.full_tile_range: Tuple[int, List[int], List[int]] = (
+            0, [0]*self.y_tile_count,
+            [self.x_tile_count-1]*self.y_tile_count)
+
         # Find the 1D index of the tile at every road lane connection to the
         # intersection. We'll use them to buffer entries and exits into the
         # intersection so vehicles don't crash as they enter or exit.
@@ -113,10 +119,8 @@ class SquareTiling(Tiling):
             seen: Dict[Tuple[int, int], List[Vehicle]] = {}
             for lane in self.lanes:
                 for vehicle in lane.vehicles:
-                    y_min, x_mins, x_maxes = self._outline_to_tile_range(tuple(
-                        Coord((c.x - self.origin.x)/self.tile_width,
-                              (c.y - self.origin.y)/self.tile_width)
-                        for c in vehicle.get_outline()))
+                    y_min, x_mins, x_maxes = self._outline_to_tile_range(
+                        self._outline_to_grid(vehicle.get_outline()))
                     for j in range(len(x_mins)):
                         y = y_min + j
                         for i in range((x_maxes[j]+1)-x_mins[j]):
@@ -190,37 +194,48 @@ class SquareTiling(Tiling):
             # system using self.origin and self.tile_width, and find the x and
             # y range covered by the outline under the assumption that the
             # outline is a convex shape.
-            y_min, x_mins, x_maxes = self._outline_to_tile_range(tuple(
-                Coord((c.x - self.origin.x)/self.tile_width,
-                      (c.y - self.origin.y)/self.tile_width)
-                for c in clone.get_outline(static_buffer=.1)))
+            y_min, x_mins, x_maxes = self._outline_to_tile_range(
+                self._outline_to_grid(clone.get_outline(static_buffer=.1)))
         else:
             # Crash probability is non-zero. Look at every tile.
-            y_min = 0
-            x_mins = [0 for _ in range(self.y_tile_count)]
-            x_maxes = [self.x_tile_count-1 for _ in range(self.y_tile_count)]
+            y_min, x_mins, x_maxes = self.full_tile_range
 
         # After the outlining process is complete, loop through the min and max
         # y-Tiles via the x-bound lists. For each y-value, add every tile
         # between the min and max x-Tiles to the return set.
         tiles_covered: Dict[Tile, float] = {}
         # Recall that the first tile layer represents the next timestep.
-        t_idx = t - (SHARED.t+1)
+        layer = self.tiles[t - (SHARED.t+1)]
         for j in range(len(x_mins)):
             y = y_min + j
-            for i in range((x_maxes[j]+1)-x_mins[j]):
-                x = x_mins[j]+i
-                tile = self.tiles[t_idx][self._tile_loc_to_id((x, y))]
-
-                # If crash probability is non-zero, find a probability of usage
-                # for every tile. If not, only tiles that will be used have
-                # been outlined, so they'll be reserved with 100% usage.
+            row_offset = y*self.x_tile_count
+
+            if self.threshold == 0:
+                # Only tiles that will be used have been outlined, so they'll
+                # be reserved with 100% usage. Slice the row out of the layer
+                # and register it in one go. Only confirmed reservations can
+                # conflict with this one, so skip the compatibility check for
+                # tiles nobody has reserved.
+                row = layer[row_offset + x_mins[j]:row_offset + x_maxes[j] + 1]
+                for tile in row:
+                    if tile.reserved_by and \
+                            not tile.will_reservation_work(reservation, 1):
+                        lane.movement_model.clean_up_projection(clone)
+                        return None
+                tiles_covered.update(dict.fromkeys(row, 1))
+                continue
+
+            for x in range(x_mins[j], x_maxes[j]+1):
+                tile = layer[row_offset + x]
+
+                # Crash probability is non-zero, so find a probability of
+                # usage for every tile.
                 p = lane.movement_model.find_probability_of_usage(
                     clone, lane.vehicle_progress[clone],
-                    self._tile_loc_to_coord((x, y)), self.tile_width, t) \
-                    if (self.threshold > 0) else 1
+                    self._tile_loc_to_coord((x, y)), self.tile_width, t)
 
-                if not tile.will_reservation_work(reservation, p):
+                if tile.reserved_by and \
+                        not tile.will_reservation_work(reservation, p):
                     lane.movement_model.clean_up_projection(clone)
                     return None
 
@@ -228,6 +243,14 @@ class SquareTiling(Tiling):
 
         return tiles_covered
 
+    def _outline_to_grid(self, outline: Tuple[Coord, ...]
+                         ) -> Tuple[Coord, ...]:
+        """Normalize a real outline to the grid's coordinate system."""
+        x0, y0 = self.origin
+        width = self.tile_width
+        return tuple(Coord((c.x - x0)/width, (c.y - y0)/width)
+                     for c in outline)
+
     def _outline_to_tile_range(self, outline: Tuple[Coord, ...]) \
             -> Tuple[int, List[int], List[int]]:
 
@@ -257,12 +280,13 @@ class SquareTiling(Tiling):
             # tracker. One of mins or maxes will be empty depending on if the
             # segment pointed up or down, as that indicates if the segment
             # alters mins or maxes.
-            for j, x_min in enumerate(x_mins_seg):
-                idx = j + y_min_seg - y_min
-                x_mins[idx] = min(x_min, x_mins[idx])
-            for j, x_max in enumerate(x_maxes_seg):
-                idx = j + y_min_seg - y_min
-                x_maxes[idx] = max(x_max, x_maxes[idx])
+            offset = y_min_seg - y_min
+            for j, x_min in enumerate(x_mins_seg, offset):
+                if x_min < x_mins[j]:
+                    x_mins[j] = x_min
+            for j, x_max in enumerate(x_maxes_seg, offset):
+                if x_max > x_maxes[j]:
+                    x_maxes[j] = x_max
             # Note: this doesn't work for non-convex outlines.
 
         # Go through the stitched range to clip tiles to between x_min, x_max,
@@ -550,8 +574,7 @@ class SquareTiling(Tiling):
             else:
                 t_prepend = t-1
 
-            while len(self.tiles) < t_prepend - SHARED.t:
-                self._add_new_layer()
+            self._extend_layers_to(t_prepend - SHARED.t)
 
             tile_id = self.buffer_tile_loc[lane.trajectory.start_coord]
             for i, p in enumerate(p_prepend):
@@ -566,8 +589,7 @@ class SquareTiling(Tiling):
             p_postpend = lane.movement_model.postpend_probabilities(
                 clone, Tiling._exit_res_timesteps_forward(clone.velocity), t)
 
-            while len(self.tiles) < t + len(p_postpend) - SHARED.t:
-                self._add_new_layer()
+            self._extend_layers_to(t + len(p_postpend) - SHARED.t)
 
             tile_id = self.buffer_tile_loc[lane.trajectory.end_coord]
             for i, p in enumerate(p_postpend):
@@ -623,11 +645,19 @@ class SquareTiling(Tiling):
         coverage.
         """
         new_timestep = SHARED.t + 1 + len(self.tiles)
-        self.tiles.append(tuple([
-            self.tile_type(self._tile_loc_to_id((x, y)), new_timestep,
-                           threshold=self.threshold)
-            for y in range(self.y_tile_count)
-            for x in range(self.x_tile_count)]))
+        # Tiles are indexed by their 1D ID. They're only created when first
+        # accessed since most of them never will be.
+        self.tiles.append(TileLayer(
+            self.tile_type, new_timestep,
+            self.x_tile_count*self.y_tile_count, threshold=self.threshold))
+
+    def _extend_layers_to(self, layers: int) -> None:
+        """Extend the tiling stack until it has at least this many layers."""
+        t0 = SHARED.t + 1
+        size = self.x_tile_count*self.y_tile_count
+        self.tiles.extend(
+            TileLayer(self.tile_type, t0 + i, size, threshold=self.threshold)
+            for i in range(len(self.tiles), layers))
 
     def _io_coord_to_tile_id(self, coord: Coord) -> int:
         """Convert a raw Coord to tile space's 1D index.
@@ -649,11 +679,12 @@ class SquareTiling(Tiling):
         y = id // self.x_tile_count
         return (x, y)
 
-    def tile_layer_to_shape(self, layer: Tuple[Tile, ...]
+    def tile_layer_to_shape(self, layer: TileLayer
                             ) -> List[Tuple[List[Coord], float, int]]:
         """Convert layer into a list of Coord outlines and color values."""
         shapes: List[Tuple[List[Coord], float, int]] = []
-        for i, tile in enumerate(layer):
+        # Tiles that were never accessed can't have been reserved.
+        for i, tile in sorted(layer.materialized.items()):
             p_usage = sum(tile.reserved_by.values())
             if p_usage > 0:
                 n_usage = len(tile.reserved_by)
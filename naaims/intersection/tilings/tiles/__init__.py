@@ -4,3 +4,5 @@ from naaims.intersection.tilings.tiles.deterministic import \
     DeterministicTile
 from naaims.intersection.tilings.tiles.stochastic import \
     StochasticTile
+from naaims.intersection.tilings.tiles.layer import \
+    TileLayer
@@ -9,6 +9,8 @@ class DeterministicTile(Tile):
     is check for sums.
     """
 
+    __slots__ = ()
+
     # TODO: (low) streamline more of the default tile logic to take advantage
     #       of these tiles being deterministic instead of stochastic, e.g.,
     #       change reserved_by to a single vehicle instead of a dict.
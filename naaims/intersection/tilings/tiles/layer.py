@@ -0,0 +1,65 @@
+"""
+A tile layer holds every tile a tiling tracks at a single timestep. Most tiles
+in a layer are never touched by a reservation, so tiles are only created the
+first time they're accessed.
+"""
+
+from typing import Dict, Iterator, List, Type, Union, overload
+
+from naaims.intersection.tilings.tiles.tile import Tile
+
+
+class TileLayer:
+    """A lazily populated layer of tiles at one timestep.
+
+    Behaves like a tuple of tiles indexed by tile ID, except that tiles are
+    only created when first accessed.
+    """
+
+    __slots__ = ('tile_type', 'time', 'size', 'threshold', 'materialized')
+
+    def __init__(self, tile_type: Type[Tile], time: int, size: int,
+                 threshold: float = 0) -> None:
+        """Create a new tile layer.
+
+        Parameters
+            tile_type: Type[Tile]
+                The type of tile to create.
+            time: int
+                The timestep this layer tracks.
+            size: int
+                The number of tiles in this layer.
+            threshold: float
+                The threshold to create tiles with.
+        """
+        self.tile_type = tile_type
+        self.time = time
+        self.size = size
+        self.threshold = threshold
+        self.materialized: Dict[int, Tile] = {}
+
+    @overload
+    def __getitem__(self, id: int) -> Tile: ...
+
+    @overload
+    def __getitem__(self, id: slice) -> List[Tile]: ...
+
+    def __getitem__(self, id: Union[int, slice]) -> Union[Tile, List[Tile]]:
+        """Return the tile with this ID, creating it if necessary."""
+        if isinstance(id, slice):
+            return [self[i] for i in range(*id.indices(self.size))]
+        tile = self.materialized.get(id)
+        if tile is None:
+            if not (0 <= id < self.size):
+                raise IndexError("Tile ID out of range.")
+            tile = self.materialized[id] = self.tile_type(
+                id, self.time, threshold=self.threshold)
+        return tile
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Tile]:
+        """Iterate through every tile in this layer, creating them all."""
+        for i in range(self.size):
+            yield self[i]
@@ -10,6 +10,8 @@ class StochasticTile(Tile):
     as is.
     """
 
+    __slots__ = ()
+
     def will_reservation_work(self, r: Reservation, p: float = 1) -> bool:
         if super().will_reservation_work(r, p=p):
             return True
@@ -19,6 +19,10 @@ class Tile(ABC):
     than a deterministic tile.
     """
 
+    # Tilings can hold a great many tiles at once (one per xy position per
+    # future timestep), so keep their per-instance footprint small.
+    __slots__ = ('__hash', 'potentials', 'reserved_by', 'threshold')
+
     def __init__(self, id: int, time: int, threshold: float = 0
                  ) -> None:
         """Create a new tile, including if it tracks potential requests.
@@ -13,9 +13,12 @@ adjustable granularity (Dresner and Stone 2008).
 
 from __future__ import annotations
 from abc import abstractmethod
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
 from math import ceil
 from typing import (TYPE_CHECKING, Optional, List, Set, Dict, Tuple, Type,
-                    TypeVar, Any, OrderedDict)
+                    TypeVar, Any, Deque)
 
 import naaims.shared as SHARED
 from naaims.archetypes import Configurable
@@ -26,7 +29,7 @@ from naaims.intersection.tilings.tiles import StochasticTile, DeterministicTile
 
 if TYPE_CHECKING:
     from naaims.road import RoadLane
-    from naaims.intersection.tilings.tiles import Tile
+    from naaims.intersection.tilings.tiles import Tile, TileLayer
     from naaims.vehicles import Vehicle
     from naaims.intersection import IntersectionLane
 
@@ -73,9 +76,14 @@ class Tiling(Configurable):
         self.active_reservations: Dict[Vehicle, Reservation] = {}
         self.queued_reservations: Dict[Vehicle, Reservation] = {}
 
-        # Declare tiling stack variable.
+        # Declare tiling stack variable. Layers are popped off the front every
+        # timestep, so use a deque.
         # (Must be implemented in child classes.)
-        self.tiles: List[Tuple[Tile, ...]] = []
+        self.tiles: Deque[TileLayer] = deque()
+
+        # Track the tiles marked with potential reservations so they can be
+        # cleared without scanning the entire tile stack.
+        self.marked_tiles: Set[Tile] = set()
 
         # Start up the cycle and save relevant info.
         self.cycle = cycle
@@ -91,9 +99,17 @@ class Tiling(Configurable):
                 self.cycle[0][0])
             self.time_left_in_cycle: int = self.cycle[0][1]
 
-        # Initialize a dict to track request checking timeouts
+        # Cache clones of road lanes to reuse across reservation tests.
+        self.road_lane_test_clones: Dict[RoadLane, RoadLane] = {}
+
+        # Initialize a dict to track request checking timeouts, and a heap of
+        # (expiry, push order, vehicle) tuples ordered by expiry so that
+        # expired timeouts can be purged without scanning the whole dict. The
+        # push order breaks ties so vehicles are never compared.
         self.timeout_until: Optional[Dict[Vehicle, int]] = {} if timeout else \
             None
+        self.timeout_heap: List[Tuple[int, int, Vehicle]] = []
+        self.timeout_order = count()
 
         # Initialize rejection threshold. This must be set by child classes.
         self._threshold: float = 0
@@ -142,17 +158,16 @@ class Tiling(Configurable):
 
     def start_reservation(self, vehicle: Vehicle) -> IntersectionLane:
         """Move reservation from scheduled to active and return its lane."""
-        if vehicle in self.queued_reservations:
-            reservation: Reservation = self.queued_reservations[vehicle]
-            del self.queued_reservations[vehicle]
-            self.active_reservations[vehicle] = reservation
-            if reservation.dependent_on is not None:
-                # This vehicle is dependent on a preceding vehicle's
-                # reservation, so enable following behavior.
-                vehicle.trailing = True
-            return reservation.lane
-        else:
+        reservation: Optional[Reservation] = self.queued_reservations.pop(
+            vehicle, None)
+        if reservation is None:
             raise ValueError("No record of a reservation for this vehicle.")
+        self.active_reservations[vehicle] = reservation
+        if reservation.dependent_on is not None:
+            # This vehicle is dependent on a preceding vehicle's reservation, so
+            # enable following behavior.
+            vehicle.trailing = True
+        return reservation.lane
 
     def clear_reservation(self, vehicle: Vehicle) -> None:
         """Clear a completed reservation from the tiling's memory."""
@@ -171,25 +186,29 @@ class Tiling(Configurable):
         defined as a list of Coords, the float determines the shape's
         transparency, and the int determines its color.
         """
-        layer: Optional[Tuple[Tile, ...]] = None
-
         # 1. Check for collisions
         self.check_for_collisions()
 
         # 2. Update tiling for the new timestep
-        if len(self.tiles) > 0:
-            layer = self.tiles.pop(0)
+        layer: Optional[TileLayer] = self.tiles.popleft() if \
+            self.tiles else None
 
-        # 3. Update the traffic signal cycle
-        self.update_cycle()
+        # 3. Update the traffic signal cycle, if there is one
+        if self.cycle is not None:
+            self.update_cycle()
 
         # 4. Update existing reservations
         self.update_active_reservations()
 
-        if visualize and (layer is not None):
-            return self.tile_layer_to_shape(layer)
-        else:
+        # 5. Purge expired request timeouts
+        if self.timeout_heap:
+            self.purge_timeouts()
+
+        # Only convert the popped layer into shapes when visualizing, which
+        # most runs don't do.
+        if (not visualize) or (layer is None):
             return None
+        return self.tile_layer_to_shape(layer)
 
     @abstractmethod
     def check_for_collisions(self) -> None:
@@ -203,21 +222,34 @@ class Tiling(Configurable):
         pass
 
     def update_cycle(self) -> None:
-        """Update the traffic signal cycle if necessary."""
-        if self.cycle is not None:
-            self.time_left_in_cycle -= 1
-            if self.time_left_in_cycle == 0:
-                # Go to the next step in the cycle.
-                self.current_step_index += 1
-
-                # Roll back to the start of the cycle if we go past the end.
-                self.current_step_index %= len(self.cycle)
+        """Update the traffic signal cycle.
 
-                # Change greenlit movements and reset the timer.
-                self.greenlit = self.greenlit_movements(
-                    self.cycle[self.current_step_index][0])
-                self.time_left_in_cycle = self.cycle[
-                    self.current_step_index][1]
+        Should only be called if this tiling has a cycle.
+        """
+        assert self.cycle is not None
+        time_left = self.time_left_in_cycle - 1
+        if time_left == 0:
+            # Go to the next step in the cycle, rolling back to the start of
+            # the cycle if we go past the end.
+            step_index = (self.current_step_index + 1) % len(self.cycle)
+            self.current_step_index = step_index
+
+            # Change greenlit movements and reset the timer.
+            lanes, time_left = self.cycle[step_index]
+            self.greenlit = self.greenlit_movements(lanes)
+        self.time_left_in_cycle = time_left
+
+    def purge_timeouts(self) -> None:
+        """Remove every request timeout that has expired by now."""
+        assert self.timeout_until is not None
+        heap = self.timeout_heap
+        t = SHARED.t
+        while heap and (heap[0][0] <= t):
+            expiry, _, vehicle = heappop(heap)
+            # The timeout may already have been cleared by check_request and
+            # replaced with a newer one, so only clear it if it matches.
+            if self.timeout_until.get(vehicle) == expiry:
+                del self.timeout_until[vehicle]
 
     def greenlit_movements(self, greenlit_lanes: Set[IntersectionLane]
                            ) -> Dict[RoadLane, Set[Coord]]:
@@ -304,6 +336,8 @@ class Tiling(Configurable):
         # TODO: (performance) Implement some request timeout function, like
         #       (t_current-t_arrival)/2.
 
+        t_now = SHARED.t
+
         # Fetch the vehicle index or indices of the lane's request.
         indices = incoming_road_lane_original.first_without_permission(
             sequence=sequence)
@@ -313,15 +347,18 @@ class Tiling(Configurable):
         else:
             counter = start = indices[0]
             end_at = indices[1]
-            originals = incoming_road_lane_original.vehicles[counter:end_at]
+            # Reference the original lane's vehicle list directly instead of
+            # slicing out the sequence. It isn't modified during the test.
+            originals = incoming_road_lane_original.vehicles
 
         # Enforce a cooldown on the frequency with which vehicles can make new
         # requests. See Dresner 2008 section 3.4.4 Timeouts.
         leader: Vehicle = incoming_road_lane_original.vehicles[counter]
-        if (self.timeout_until is not None) and \
-                (leader in self.timeout_until):
-            t_timeout_expired = self.timeout_until[leader]
-            if t_timeout_expired <= SHARED.t:
+        if self.timeout_until is not None:
+            t_timeout_expired = self.timeout_until.get(leader)
+            if t_timeout_expired is None:
+                pass
+            elif t_timeout_expired <= t_now:
                 # Timeout complete. Remove vehicle from the timeout list.
                 del self.timeout_until[leader]
             else:
@@ -342,43 +379,61 @@ class Tiling(Configurable):
 
         # Fetch and clone the request's incoming lane, IntersectionLane, and
         # outgoing lane.
-        incoming_road_lane = incoming_road_lane_original.clone()
-        outgoing_coord: Coord = new_exit.vehicle.next_movements(
-            incoming_road_lane.trajectory.end_coord)[0]
+        incoming_road_lane = self._road_lane_test_clone(
+            incoming_road_lane_original)
+        end_coord = incoming_road_lane.trajectory.end_coord
+        outgoing_coord: Coord = new_exit.vehicle.next_movements(end_coord)[0]
         intersection_lane_original: IntersectionLane = self.lanes_by_endpoints[
-            (incoming_road_lane.trajectory.end_coord, outgoing_coord)]
+            (end_coord, outgoing_coord)]
         intersection_lane = intersection_lane_original.clone()
-        outgoing_road_lane: RoadLane = self.outgoing_road_lane_by_coord[
-            outgoing_coord].clone()
+        outgoing_road_lane = self._road_lane_test_clone(
+            self.outgoing_road_lane_by_coord[outgoing_coord])
 
         # Initialize data structures used for reservations.
         clone_to_original: Dict[Vehicle, Vehicle] = {}
         test_reservations: Dict[Vehicle, Reservation] = {}
-        valid_reservations: OrderedDict[Vehicle, Reservation] = OrderedDict()
+        valid_reservations: Dict[Vehicle, Reservation] = {}
         last_exit: Optional[ScheduledExit] = None
 
+        # Bound the length of the test. No vehicle in the sequence should take
+        # longer than twice the time needed to cover the incoming lane, the
+        # intersection lane, and its own buffered length starting from rest.
+        t_max = test_t + self._test_timesteps_bound(
+            incoming_road_lane, intersection_lane, end_at - counter)
+
         # Mock the simulation loop until all vehicles in the test sequence
-        # have spawned, progressed, and exited the intersection lane.
+        # have spawned, progressed, and exited the intersection lane. Bind the
+        # step method once since it's called every test timestep.
+        mock_step = self._mock_step
         while (len(intersection_lane.vehicles) > 0) or (counter < end_at):
             test_complete, counter, test_t, last_exit, new_exit = \
-                self._mock_step(start, counter, end_at, test_t, new_exit,
-                                incoming_road_lane, intersection_lane,
-                                outgoing_road_lane, clone_to_original,
-                                test_reservations, valid_reservations,
-                                last_exit, originals,
-                                incoming_road_lane_original,
-                                intersection_lane_original)
+                mock_step(start, counter, end_at, test_t, new_exit,
+                          incoming_road_lane, intersection_lane,
+                          outgoing_road_lane, clone_to_original,
+                          test_reservations, valid_reservations, last_exit,
+                          originals, incoming_road_lane_original,
+                          intersection_lane_original)
             if test_complete:
                 break
+            if test_t > t_max:
+                # The test has stalled, so scrap every reservation still being
+                # tested and decouple it from the last valid reservation.
+                if len(intersection_lane.vehicles) > 0:
+                    stalled = test_reservations[intersection_lane.vehicles[0]]
+                    if stalled.dependent_on is not None:
+                        stalled.dependent_on.dependency = None
+                break
 
         if (self.timeout_until is not None) and len(valid_reservations) == 0:
             # Enforce a timeout until the vehicle can make its next request.
             # This timeout will be the smaller of half a second (in timesteps)
             # or half the difference between the current time and the vehicle's
             # arrival time.
-            self.timeout_until[leader] = SHARED.t + \
-                round(min(.5*SHARED.SETTINGS.steps_per_second,
-                          (leader_arrival - SHARED.t)/2))
+            sps = SHARED.SETTINGS.steps_per_second
+            expiry = t_now + round(min(.5*sps, (leader_arrival - t_now)/2))
+            self.timeout_until[leader] = expiry
+            heappush(self.timeout_heap,
+                     (expiry, next(self.timeout_order), leader))
 
         # Return the leading reservation in the sequence and its vehicle's
         # index in the incoming road lane, if there are any valid reservations.
@@ -390,8 +445,45 @@ class Tiling(Configurable):
             for layer in leading_request.tiles.values():
                 for tile, p in layer.items():
                     tile.mark(leading_request, p)
+                self.marked_tiles.update(layer)
         return leading_request, start
 
+    def _road_lane_test_clone(self, original: RoadLane) -> RoadLane:
+        """Return an empty clone of a road lane for reservation testing.
+
+        Reuses the clone from previous tests after resetting everything a test
+        can change on it, the same way clone() does.
+        """
+        clone = self.road_lane_test_clones.get(original)
+        if clone is None:
+            clone = self.road_lane_test_clones[original] = original.clone()
+        else:
+            clone.reset_for_requests()
+        return clone
+
+    @staticmethod
+    def _test_timesteps_bound(incoming_road_lane: RoadLane,
+                              intersection_lane: IntersectionLane,
+                              vehicles: int) -> int:
+        """Return a generous upper bound on a reservation test's length.
+
+        For each vehicle in the sequence, allows twice the time it would take
+        to travel the length of the incoming and intersection lanes plus a
+        maximum length vehicle from a dead stop, accelerating up to the speed
+        limit.
+        """
+        distance = incoming_road_lane.trajectory.length + \
+            intersection_lane.trajectory.length + \
+            SHARED.SETTINGS.max_vehicle_length * \
+            (1 + 2*SHARED.SETTINGS.length_buffer_factor)
+        v_max = min(incoming_road_lane.speed_limit,
+                    intersection_lane.speed_limit)
+        # Upper bound on travel time whether or not v_max is reached.
+        traversal_time = distance/v_max + \
+            v_max/(2*SHARED.SETTINGS.min_acceleration)
+        return ceil(2*traversal_time*SHARED.SETTINGS.steps_per_second) * \
+            max(vehicles, 1)
+
     def _mock_step(self, start: int, counter: int, end_at: int, test_t: int,
                    new_exit: Optional[ScheduledExit],
                    incoming_road_lane: RoadLane,
@@ -399,7 +491,7 @@ class Tiling(Configurable):
                    outgoing_road_lane: RoadLane,
                    clone_to_original: Dict[Vehicle, Vehicle],
                    test_reservations: Dict[Vehicle, Reservation],
-                   valid_reservations: OrderedDict[Vehicle, Reservation],
+                   valid_reservations: Dict[Vehicle, Reservation],
                    last_exit: Optional[ScheduledExit],
                    originals: List[Vehicle],
                    incoming_road_lane_original: RoadLane,
@@ -498,6 +590,8 @@ class Tiling(Configurable):
         Speed updates are controlled by the intersection so only calling the
         intersection lane's get_new_speeds function is necessary.
         """
+        if not intersection_lane.vehicles:
+            return
         for vehicle, update in intersection_lane.get_new_speeds().items():
             vehicle.velocity = update.velocity
             vehicle.acceleration = update.acceleration
@@ -510,6 +604,8 @@ class Tiling(Configurable):
         longer be able to update its position. This shouldn't happen; if it
         does the outgoing road is way too short.
         """
+        if not outgoing_road_lane.vehicles:
+            return
         transfers = outgoing_road_lane.step_vehicles()
         if len(transfers) > 0:
             for transfer in transfers:
@@ -521,7 +617,7 @@ class Tiling(Configurable):
                                          outgoing_road_lane: RoadLane,
                                          test_reservations: Dict[Vehicle,
                                                                  Reservation],
-                                         valid_reservations: OrderedDict[
+                                         valid_reservations: Dict[
                                              Vehicle, Reservation],
                                          test_t: int) -> bool:
         """Handle progression on intersection lane, including transfers.
@@ -569,7 +665,7 @@ class Tiling(Configurable):
                     res = test_reservations[clone]
                     valid_reservations[res.vehicle] = res
                     del test_reservations[clone]
-                    outgoing_road_lane.vehicles = []
+                    outgoing_road_lane.vehicles.clear()
                     del outgoing_road_lane.vehicle_progress[clone], clone, res
             else:
                 outgoing_road_lane.enter_vehicle_section(transfer)
@@ -587,6 +683,9 @@ class Tiling(Configurable):
 
         Also transfers clone sections onto the intersection lane if necessary.
         """
+        if not incoming_road_lane.vehicles:
+            # No clone is waiting to spawn, so nothing can transfer.
+            return last_exit
         transfers = incoming_road_lane.step_vehicles()
         for transfer in transfers:
             intersection_lane.enter_vehicle_section(transfer)
@@ -603,7 +702,7 @@ class Tiling(Configurable):
                          clone_to_original: Dict[Vehicle, Vehicle],
                          test_reservations: Dict[Vehicle,
                                                  Reservation],
-                         valid_reservations: OrderedDict[Vehicle, Reservation],
+                         valid_reservations: Dict[Vehicle, Reservation],
                          counter: int, end_at: int,
                          test_t: int) -> int:
         """Log the tiles used by all clones at this test_t.
@@ -616,7 +715,6 @@ class Tiling(Configurable):
         Returns:
             counter (unchanged) in most cases
         """
-        to_remove: List[Vehicle] = []
         for i, clone in enumerate(intersection_lane.vehicles):
             reservation = test_reservations[clone]
             tiles_used = self.pos_to_tiles(intersection_lane, test_t,
@@ -641,19 +739,19 @@ class Tiling(Configurable):
                 test_reservations[intersection_lane.vehicles[i-1]
                                   ].dependency = None
 
-                # Delete the clones after this one, their progress, and
-                # unmarked their marked tiles if necessary.
-                to_remove += intersection_lane.vehicles[i:]
+                # Delete the clones after this one and their progress. They
+                # form the tail of the intersection lane, so truncate it.
                 for clone_to_del in intersection_lane.vehicles[i:]:
                     del clone_to_original[clone_to_del]
                     del test_reservations[clone_to_del]
+                    del intersection_lane.vehicle_progress[clone_to_del]
+                del intersection_lane.vehicles[i:]
 
                 # Delete the clone on the upstream lane and stop spawning new
-                # clones.
-                if len(incoming_road_lane.vehicles) > 0:
-                    clone = incoming_road_lane.vehicles[0]
-                    del incoming_road_lane.vehicle_progress[clone]
-                    incoming_road_lane.vehicles = []
+                # clones. It's the only clone the upstream lane ever holds, so
+                # just empty the lane in place.
+                incoming_road_lane.vehicles.clear()
+                incoming_road_lane.vehicle_progress.clear()
                 counter = end_at
 
                 # Break out of the loop since we don't need to update
@@ -662,11 +760,6 @@ class Tiling(Configurable):
                 # requests ahead of this one are valid).
                 break
 
-        # Finalize removals from the intersection lane.
-        for clone in to_remove:
-            intersection_lane.vehicles.remove(clone)
-            del intersection_lane.vehicle_progress[clone]
-
         return counter
 
     def _spawn_next_clone(self, intersection_lane: IntersectionLane,
@@ -675,8 +768,7 @@ class Tiling(Configurable):
                           clone_to_original: Dict[Vehicle, Vehicle],
                           test_reservations: Dict[Vehicle,
                                                   Reservation],
-                          valid_reservations: OrderedDict[Vehicle,
-                                                          Reservation],
+                          valid_reservations: Dict[Vehicle, Reservation],
                           new_exit: ScheduledExit,
                           start: int, counter: int, end_at: int,
                           test_t: int,
@@ -696,20 +788,20 @@ class Tiling(Configurable):
             # This vehicle needs to follow the clone spawned ahead of it in the
             # intersection lane.
             clone.trailing = True
-        idx = counter - start - 1
-        preceding_vehicle = originals[idx] if (idx >= 0) else None
+        preceding_vehicle = originals[counter-1] if (counter > start) else \
+            None
         preceding_res: Optional[Reservation] = None
         predecessors: Set[Reservation] = set()
         if preceding_vehicle is not None:
-            # TODO: Alter clone_to_original as it's used for little else other
-            #       than this use case.
-            original_to_clone = {original: clone for clone, original in
-                                 clone_to_original.items()}
-            preceding_clone = original_to_clone[preceding_vehicle]
-            preceding_res = test_reservations.get(preceding_clone)
+            # If the preceding vehicle's reservation isn't already valid, its
+            # clone must still be in the intersection lane. Since clones only
+            # spawn once the one before them has fully entered the
+            # intersection, it's the last vehicle there.
+            preceding_res = valid_reservations.get(preceding_vehicle)
             if preceding_res is None:
-                preceding_res = valid_reservations.get(preceding_vehicle)
-            assert preceding_res is not None
+                preceding_res = test_reservations[
+                    intersection_lane.vehicles[-1]]
+            assert preceding_res.vehicle is preceding_vehicle
             predecessors = set(preceding_res.predecessors)
             predecessors.add(preceding_res)
         reservation = Reservation(
@@ -732,17 +824,16 @@ class Tiling(Configurable):
         #       RoadLane.progress_at_exit(counter, new_exit)
 
         # Load its center and rear sections onto the incoming lane.
+        lbf = SHARED.SETTINGS.length_buffer_factor
+        lane_length = incoming_road_lane.trajectory.length
+        lane_start = incoming_road_lane.trajectory.start_coord
         incoming_road_lane.add_vehicle(clone)
         incoming_road_lane.enter_vehicle_section(VehicleTransfer(
             clone, VehicleSection.CENTER,
-            incoming_road_lane.trajectory.length - clone.length *
-            (.5 + SHARED.SETTINGS.length_buffer_factor),
-            incoming_road_lane.trajectory.start_coord))
+            lane_length - clone.length*(.5 + lbf), lane_start))
         incoming_road_lane.enter_vehicle_section(VehicleTransfer(
             clone, VehicleSection.REAR,
-            incoming_road_lane.trajectory.length - clone.length *
-            (1 + 2*SHARED.SETTINGS.length_buffer_factor),
-            incoming_road_lane.trajectory.start_coord))
+            lane_length - clone.length*(1 + 2*lbf), lane_start))
 
         # Transfer its front section onto the intersection lane.
         intersection_lane.enter_vehicle_section(VehicleTransfer(
@@ -829,9 +920,7 @@ class Tiling(Configurable):
         # keep creating new layers until we reach this timestep.
         if t <= SHARED.t:
             raise ValueError("t must be a future timestep.")
-        timesteps_from_now = t - SHARED.t
-        while len(self.tiles) < timesteps_from_now:
-            self._add_new_layer()
+        self._extend_layers_to(t - SHARED.t)
 
         # Find the tiles this vehicle is estimated to use at this timestep by
         # using the clone's properties and proportional progress along the
@@ -886,14 +975,11 @@ class Tiling(Configurable):
         Based on Toader's modification to AIM4 by Au, Stone, and Dresner.
         http://www.cs.utexas.edu/~aim/aim4sim/versions/AIM4-release-1.0.4-fixed-collisions-notes.pdf
         """
-        return ceil((.3 + max(0, velocity - 15)*.2
-                     )*SHARED.SETTINGS.steps_per_second)
-
-    def clear_marked_tiles(self, reservation: Reservation) -> None:
-        """Clear tiles marked with this reservation before discarding."""
-        for tile_layer in self.tiles:
-            for tile in tile_layer:
-                tile.remove_mark(reservation)
+        sps = SHARED.SETTINGS.steps_per_second
+        if velocity <= 15:
+            # Slower vehicles all use the same buffer length.
+            return ceil(.3*sps)
+        return ceil((.3 + (velocity - 15)*.2)*sps)
 
     def confirm_reservation(self, reservation: Reservation, lane: RoadLane,
                             ) -> None:
@@ -936,10 +1022,10 @@ class Tiling(Configurable):
         raise NotImplementedError("TODO")
 
     def clear_potential_reservations(self) -> None:
-        """Go through all tiles and clear potential reservation markings."""
-        for tile_layer in self.tiles:
-            for tile in tile_layer:
-                tile.remove_all_marks()
+        """Clear potential reservation markings from all marked tiles."""
+        for tile in self.marked_tiles:
+            tile.remove_all_marks()
+        self.marked_tiles.clear()
 
     # Support methods used by the Tiling
 
@@ -956,6 +1042,14 @@ class Tiling(Configurable):
         """
         raise NotImplementedError("Must be implemented in child classes.")
 
+    def _extend_layers_to(self, layers: int) -> None:
+        """Extend the tiling stack until it has at least this many layers.
+
+        Child classes may override this to add every missing layer at once.
+        """
+        while len(self.tiles) < layers:
+            self._add_new_layer()
+
     @property
     def threshold(self) -> float:
         """Return the probability threshold per tile."""
@@ -964,7 +1058,7 @@ class Tiling(Configurable):
         return self._threshold
 
     @abstractmethod
-    def tile_layer_to_shape(self, layer: Tuple[Tile, ...]
+    def tile_layer_to_shape(self, layer: TileLayer
                             ) -> List[Tuple[List[Coord], float, int]]:
         """Convert a tile layer to plottable Coords.
 
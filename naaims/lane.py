@@ -29,6 +29,9 @@ if TYPE_CHECKING:
 
 L = TypeVar('L', bound='Lane')
 
+# Vehicle sections in the order of their VehicleProgress indices.
+SECTIONS: Tuple[VehicleSection, ...] = tuple(VehicleSection)
+
 
 class LateralDeviation(NamedTuple):
     """Describes how far a vehicle has deviated perpendicular to a lane.
@@ -106,6 +109,19 @@ class Lane(ABC):
         self.vehicles: List[Vehicle] = []
         self.vehicle_progress: Dict[Vehicle, VehicleProgress] = {}
 
+    @property
+    def trajectory(self) -> Trajectory:
+        """The trajectory of the road that contains the lane."""
+        return self._trajectory
+
+    @trajectory.setter
+    def trajectory(self, trajectory: Trajectory) -> None:
+        self._trajectory = trajectory
+        # Cache trajectory properties read for every vehicle on every step.
+        # Recomputed here so they follow the trajectory if it's replaced.
+        self.trajectory_length: float = trajectory.length
+        self.trajectory_end: Coord = trajectory.end_coord
+
     # Support functions for speed updates
 
     def effective_speed_limit(self, p: float, vehicle: Vehicle) -> float:
@@ -141,21 +157,38 @@ class Lane(ABC):
                 and slow down to allow for another vehicle to merge in.
         """
         new_speed: Dict[Vehicle, SpeedUpdate] = {}
+        if not self.vehicles:
+            return new_speed
+
+        # Bind the per-vehicle methods once instead of resolving them through
+        # the instance on every iteration.
+        controls_this_speed = self.controls_this_speed
+        accel_update = self.accel_update
+        speed_update = self.speed_update
+        effective_speed_limit = self.effective_speed_limit
+        min_braking = SHARED.SETTINGS.min_braking
+        # Most lanes have no vehicles to slow, so skip hashing every vehicle
+        # against an empty set.
+        any_to_slow = len(to_slow) > 0
 
         # Track preceding vehicle in order to avoid colliding with it.
         # (accel_update will check if there's a vehicle in the downstream.)
         preceding: Optional[Vehicle] = None
         # self.vehicles is in order of decreasing progress
         for vehicle in self.vehicles:
-            vehicle_in_jurisdiction, p, section = self.controls_this_speed(
-                vehicle)
+            vehicle_in_jurisdiction, p, section = controls_this_speed(vehicle)
             if vehicle_in_jurisdiction:  # update its speed
+                # The speed limit depends only on the vehicle and its progress,
+                # so find it once and share it with every update below.
+                limit = effective_speed_limit(p, vehicle)
                 # A vehicle being in to_slow overrides any acceleration logic
                 # defined in accel_update, instead telling the vehicle to start
                 # braking no matter what.
-                a_new = (SHARED.SETTINGS.min_braking if vehicle in to_slow else
-                         self.accel_update(vehicle, section, p, preceding))
-                new_speed[vehicle] = self.speed_update(vehicle, p, a_new)
+                if any_to_slow and (vehicle in to_slow):
+                    a_new = min_braking
+                else:
+                    a_new = accel_update(vehicle, section, p, preceding, limit)
+                new_speed[vehicle] = speed_update(vehicle, p, a_new, limit)
 
             preceding = vehicle
 
@@ -169,7 +202,8 @@ class Lane(ABC):
 
     @abstractmethod
     def accel_update(self, vehicle: Vehicle, section: VehicleSection, p: float,
-                     preceding: Optional[Vehicle]) -> float:
+                     preceding: Optional[Vehicle],
+                     effective_speed_limit: Optional[float] = None) -> float:
         """Should return a vehicle's new acceleration.
 
         Note that this function does NOT change a vehicle's own record of its
@@ -179,6 +213,9 @@ class Lane(ABC):
         there is none, the vehicle is at the head of the queue and must stop at
         the intersection line if it doesn't have permission to enter the
         intersection.
+
+        effective_speed_limit is the vehicle's effective speed limit at p, if
+        the caller has already found it. Otherwise it's found as needed.
         """
 
         available_stopping_distance: float
@@ -191,12 +228,13 @@ class Lane(ABC):
 
             if downstream_stopping_distance is None:
                 # There's nothing to stop for. Full speed forward.
-                return self.accel_update_uncontested(vehicle, p)
+                return self.accel_update_uncontested(vehicle, p,
+                                                     effective_speed_limit)
             elif section is VehicleSection.FRONT:
                 # The stopping distance is the sum of the downstream stopping
                 # distance plus the length left in this lane.
                 available_stopping_distance = downstream_stopping_distance + \
-                    (1-p)*self.trajectory.length
+                    (1-p)*self.trajectory_length
             else:
                 # The stopping distance is just what we have downstream because
                 # it's straddling the seam.
@@ -222,7 +260,8 @@ class Lane(ABC):
                 preceding_vehicle_progress, p,
                 preceding.stopping_distance())
         return self.accel_update_following(
-            vehicle, p, available_stopping_distance=available_stopping_distance
+            vehicle, p, available_stopping_distance=available_stopping_distance,
+            effective_speed_limit=effective_speed_limit
         )
 
     @staticmethod
@@ -246,7 +285,7 @@ class Lane(ABC):
             vehicle_stopping_distance: float
                 The stopping distance of the preceding vehicle.
         """
-        return (pre_p - p)*self.trajectory.length + vehicle_stopping_distance
+        return (pre_p - p)*self.trajectory_length + vehicle_stopping_distance
 
     @abstractmethod
     def downstream_stopping_distance(self) -> Optional[float]:
@@ -259,18 +298,20 @@ class Lane(ABC):
         We assume that this distance is the stopping distance of the last
         vehicle plus how far it is along the trajectory.
         """
-        if len(self.vehicles) == 0:
+        vehicles = self.vehicles
+        if not vehicles:
             return None
         else:
-            vehicle: Vehicle = self.vehicles[-1]
-            pre_p: Optional[float] = self.vehicle_progress[vehicle].rear
+            vehicle: Vehicle = vehicles[-1]
+            progress = self.vehicle_progress[vehicle]
+            pre_p: Optional[float] = progress.rear
             p: Optional[float] = 0
             if pre_p is None:
                 # This vehicle is the vehicle we're checking the stopping
                 # distance for. Check if there's another vehicle ahead of it.
-                if len(self.vehicles) > 1:
-                    p = self.vehicle_progress[vehicle].front
-                    vehicle = self.vehicles[-2]
+                if len(vehicles) > 1:
+                    p = progress.front
+                    vehicle = vehicles[-2]
                     pre_p = self.vehicle_progress[vehicle].rear
                 else:
                     # There's no vehicle ahead of this one. The lane is free.
@@ -280,14 +321,20 @@ class Lane(ABC):
             return self.available_stopping_distance(
                 pre_p, p, vehicle.stopping_distance())
 
-    def accel_update_uncontested(self, vehicle: Vehicle, p: float) -> float:
+    def accel_update_uncontested(self, vehicle: Vehicle, p: float,
+                                 effective_speed_limit: Optional[float] = None
+                                 ) -> float:
         """Return accel update if there are no conflicts ahead.
 
         p is the proportional progress associated with this vehicle. Because it
         could be the front or rear of the vehicle depending on the situation,
         it's presented here as an input argument.
+
+        effective_speed_limit can be provided if it's already been calculated
+        for this vehicle at p.
         """
-        effective_speed_limit = self.effective_speed_limit(p, vehicle)
+        if effective_speed_limit is None:
+            effective_speed_limit = self.effective_speed_limit(p, vehicle)
         if vehicle.velocity > effective_speed_limit:
             return SHARED.SETTINGS.min_braking
         elif vehicle.velocity == effective_speed_limit:
@@ -297,7 +344,9 @@ class Lane(ABC):
 
     def accel_update_following(self, vehicle: Vehicle, p: float,
                                available_stopping_distance: Optional[
-                                   float] = None) -> float:
+                                   float] = None,
+                               effective_speed_limit: Optional[float] = None
+                               ) -> float:
         """Return accel update to prevent collision with a preceding object.
 
         p is the proportional progress associated with this vehicle. Because it
@@ -311,42 +360,47 @@ class Lane(ABC):
         assumes that there are no vehicles preceding this one and defaults to
         calculating the stopping distance as the length of lane left ahead of
         this vehicle.
+
+        effective_speed_limit can be provided if it's already been calculated
+        for this vehicle at p.
         """
         # Check the acceleration against the speed limit.
-        a_maybe = self.accel_update_uncontested(vehicle, p)
+        a_maybe = self.accel_update_uncontested(vehicle, p,
+                                                effective_speed_limit)
         if a_maybe < 0:  # need to brake regardless of closeness
             return a_maybe
 
         # Default to the distance to the intersection if the available stopping
         # distance is not provided.
-        available_stopping_distance = (1-p)*self.trajectory.length if \
+        available_stopping_distance = (1-p)*self.trajectory_length if \
             available_stopping_distance is None \
             else available_stopping_distance
 
         # In theory all of these cases should be one timestep of acceleration
         # less, but we add one to have some padding to avoid just barely
         # colliding with the object being followed.
-        acceleration_option_speed = vehicle.velocity + \
-            SHARED.SETTINGS.TIMESTEP_LENGTH * SHARED.SETTINGS.min_acceleration
-        if vehicle.stopping_distance(
-            acceleration_option_speed + SHARED.SETTINGS.TIMESTEP_LENGTH *
-                SHARED.SETTINGS.min_acceleration
-        ) <= available_stopping_distance:
+        min_acceleration = SHARED.SETTINGS.min_acceleration
+        min_braking = SHARED.SETTINGS.min_braking
+        dv = SHARED.SETTINGS.TIMESTEP_LENGTH * min_acceleration
+        acceleration_option_speed = vehicle.velocity + dv
+        if vehicle.stopping_distance(acceleration_option_speed + dv) <= \
+                available_stopping_distance:
             # Accelerating will still keep this vehicle in the available
             # stopping distance. Make sure to check against the speed limit.
-            return min(a_maybe, SHARED.SETTINGS.min_acceleration)
-        elif vehicle.stopping_distance(acceleration_option_speed
-                                       ) <= available_stopping_distance:
+            return min(a_maybe, min_acceleration)
+        elif vehicle.stopping_distance(acceleration_option_speed) <= \
+                available_stopping_distance:
             # Maintaining speed will keep this vehicle in the available
             # stopping distance, but speeding up won't.
             return 0
         else:
             # We have to brake to even have a chance of getting back to or
             # staying in the stopping distance.
-            return SHARED.SETTINGS.min_braking
+            return min_braking
 
-    def speed_update(self, vehicle: Vehicle, p: float,
-                     accel: float) -> SpeedUpdate:
+    def speed_update(self, vehicle: Vehicle, p: float, accel: float,
+                     effective_speed_limit: Optional[float] = None
+                     ) -> SpeedUpdate:
         """Given a vehicle and its acceleration, update speed and return both.
 
         Notes:
@@ -357,18 +411,20 @@ class Lane(ABC):
         p is the proportional progress associated with this vehicle. Because it
         could be the front or rear of the vehicle depending on the situation,
         it's presented here as an input argument.
+
+        effective_speed_limit can be provided if it's already been calculated
+        for this vehicle at p.
         """
         v_new = vehicle.velocity + accel*SHARED.SETTINGS.TIMESTEP_LENGTH
-        if v_new < 0:
-            return SpeedUpdate(velocity=0, acceleration=accel)
-        else:
+        if effective_speed_limit is None:
             effective_speed_limit = self.effective_speed_limit(p, vehicle)
-            if v_new > effective_speed_limit:
-                return SpeedUpdate(velocity=effective_speed_limit,
-                                   acceleration=accel if vehicle.velocity <
-                                   effective_speed_limit else 0)
-            else:
-                return SpeedUpdate(velocity=v_new, acceleration=accel)
+        if v_new > effective_speed_limit:
+            return SpeedUpdate(effective_speed_limit,
+                               accel if vehicle.velocity <
+                               effective_speed_limit else 0)
+        # Clip negative speeds to a stop. (The speed limit is always positive,
+        # so this can't conflict with the clip above.)
+        return SpeedUpdate(max(v_new, 0), accel)
         # TODO: (stochasticity+) Consider enforcing the speed limit clip in
         #       accel_update instead of here to make perturbing speed and
         #       acceleration easier. Will need to double check for functions
@@ -393,61 +449,60 @@ class Lane(ABC):
         # fully exited vehicles we need to remove from this lane.
         exiting: List[VehicleTransfer] = []
         to_remove: List[Vehicle] = []
+        if not self.vehicles:
+            return exiting
+
+        # Bind the per-vehicle methods and progress record once.
+        vehicle_progress = self.vehicle_progress
+        update_vehicle_progress = self.update_vehicle_progress
+        has_vehicle_exited = self.has_vehicle_exited
 
         # Track our progression backwards through the lane.
         last_progress: float = 1.1  # Max (non-None) progress is 1.
         # self.vehicles should be in order of decreasing progress
         for vehicle in self.vehicles:
 
-            new_progress_packet = self.update_vehicle_progress(
-                vehicle=vehicle,
-                old_progress=self.vehicle_progress[vehicle],
-                preceding_section_progress=last_progress
-            )
-            new_vehicle_progress = new_progress_packet[0]
-            last_progress = new_progress_packet[1]
-            exiting += new_progress_packet[2]
+            new_vehicle_progress, last_progress, exiting_sections = \
+                update_vehicle_progress(vehicle, vehicle_progress[vehicle],
+                                        last_progress)
+            if exiting_sections:
+                exiting.extend(exiting_sections)
 
             # Check if this vehicle has fully exited.
-            if self.has_vehicle_exited(new_vehicle_progress):
+            if has_vehicle_exited(new_vehicle_progress):
                 # If so, mark it for removal from this lane.
                 to_remove.append(vehicle)
             else:
                 # Otherwise update vehicle_progress with the new values
-                self.vehicle_progress[vehicle] = new_vehicle_progress
+                vehicle_progress[vehicle] = new_vehicle_progress
 
             # If the center of the vehicle is in this lane, update its pos
-            if new_vehicle_progress.center is not None:
-
-                # Check if this is the lane responsible for updating this
-                # vehicle's lateral deviation. (A vehicle can be present in
-                # multiple lanes during a lane change.)
-                if ((vehicle in lateral_deviations) and
-                        (self is not lateral_deviations[vehicle].lane)):
-                    # If not, skip the update.
-                    continue
+            center = new_vehicle_progress.center
+            if center is not None:
 
-                lateral: float = 0
-                if ((vehicle in lateral_deviations)
-                        and (self is lateral_deviations[vehicle].lane)):
+                # Only look for an externally calculated lateral movement if
+                # any were provided. (None usually are.)
+                deviation = lateral_deviations.get(vehicle) if \
+                    lateral_deviations else None
+
+                lateral: float
+                if deviation is None:
+                    # We need to infer this vehicle's lateral movement.
+                    lateral = self.lateral_deviation_for(vehicle, center)
+                elif deviation.lane is self:
                     # We have a precalculated lateral movement for this
                     # vehicle and it's defined as relative to this lane.
                     # This lateral movement is relative to this lane,
                     # so we're ok to include it in our position update.
-                    lateral = lateral_deviations[vehicle].d
+                    lateral = deviation.d
                 else:
-                    # We need to infer this vehicle's lateral movement.
-                    lateral = self.lateral_deviation_for(
-                        vehicle,
-                        new_vehicle_progress.center
-                    )
+                    # This isn't the lane responsible for updating this
+                    # vehicle's lateral deviation. (A vehicle can be present in
+                    # multiple lanes during a lane change.) Skip the update.
+                    continue
 
                 # Update the vehicle's own position Coord.
-                self.update_vehicle_position(
-                    vehicle,
-                    new_vehicle_progress.center,
-                    lateral
-                )
+                self.update_vehicle_position(vehicle, center, lateral)
 
         # Remove the vehicles marked as exiting from this lane.
         for vehicle in to_remove:
@@ -487,12 +542,14 @@ class Lane(ABC):
         new_vehicle_progress: List[Optional[float]] = [None, None, None]
 
         # Find the distance traveled in this timestep.
-        distance_traveled: float = vehicle.velocity * \
-            SHARED.SETTINGS.TIMESTEP_LENGTH + \
-            .5 * vehicle.acceleration * SHARED.SETTINGS.TIMESTEP_LENGTH**2
+        dt = SHARED.SETTINGS.TIMESTEP_LENGTH
+        distance_traveled: float = vehicle.velocity*dt + \
+            .5*vehicle.acceleration*dt*dt
+        # Convert it into proportional progress once for all three sections.
+        progress_traveled = distance_traveled/self.trajectory_length
 
         # Iterate through the 3 sections of the vehicle.
-        for i, progress in enumerate(old_progress):
+        for i, (section, progress) in enumerate(zip(SECTIONS, old_progress)):
 
             # Check if we have a progress record for this section.
             if progress is None:
@@ -501,8 +558,7 @@ class Lane(ABC):
                 # for this section. If not, error.
                 if preceding_section_progress > 1:
                     # We're on the downstream end of the lane.
-                    if (VehicleSection(i) in {VehicleSection.FRONT,
-                                              VehicleSection.CENTER}):
+                    if section is not VehicleSection.REAR:
                         # This vehicle front or center section is already in
                         # the downstream object. Nothing to do here.
                         new_vehicle_progress[i] = None
@@ -512,7 +568,7 @@ class Lane(ABC):
                         # fully exited and be out of this lane.
                         raise RuntimeError("Exited vehicle not removed or lane"
                                            " is too short.")
-                elif VehicleSection(i) is VehicleSection.FRONT:
+                elif section is VehicleSection.FRONT:
                     # last_progress is telling us that we've already looked at
                     # at least one vehicle, but if this next vehicle's front
                     # section is still None that means that it's the first
@@ -529,7 +585,7 @@ class Lane(ABC):
                     new_vehicle_progress[i] = progress
                     preceding_section_progress = 1.1
                     continue
-                elif VehicleSection(i) is VehicleSection.CENTER:
+                elif section is VehicleSection.CENTER:
                     # The front of this vehicle is in the lane but this
                     # center section and the rear section are still in the
                     # upstream intersection. This is ok.
@@ -556,17 +612,16 @@ class Lane(ABC):
                 warn("Vehicles overlap in-lane. This may be a collision.")
 
             # Update relative position.
-            new_progress: float = progress + \
-                distance_traveled/self.trajectory.length
+            new_progress: float = progress + progress_traveled
             if new_progress > 1:
                 # Vehicle section has exited. Find the distance it moves past
                 # the end of the lane, create a VehicleTransfer object for it,
                 # add it to the return list, and update its section record.
                 exiting.append(VehicleTransfer(
                     vehicle=vehicle,
-                    section=VehicleSection(i),
-                    distance_left=(new_progress - 1)*self.trajectory.length,
-                    pos=self.trajectory.end_coord
+                    section=section,
+                    distance_left=(new_progress - 1)*self.trajectory_length,
+                    pos=self.trajectory_end
                 ))
                 new_vehicle_progress[i] = None
             else:
@@ -575,11 +630,8 @@ class Lane(ABC):
             # Remember progress of this section for the next section's checks.
             preceding_section_progress = new_progress
 
-        return VehicleProgress(
-            front=new_vehicle_progress[0],
-            center=new_vehicle_progress[1],
-            rear=new_vehicle_progress[2]
-        ), preceding_section_progress if preceding_section_progress <= 1 \
+        return VehicleProgress._make(new_vehicle_progress), \
+            preceding_section_progress if preceding_section_progress <= 1 \
             else 1, exiting
 
     def lateral_deviation_for(self, vehicle: Vehicle,
@@ -658,7 +710,6 @@ class Lane(ABC):
                 last timestep but now its middle section is transferring.
         """
         vehicle: Vehicle = transfer.vehicle
-        new_vehicle_progress: List[Optional[float]] = list(old_progress)
 
         # Find how far along the lane this vehicle section will be in meters.
         d: float
@@ -670,13 +721,11 @@ class Lane(ABC):
             if transfer.section is VehicleSection.FRONT:
                 # Place the front vehicle section ahead at its full length plus
                 # the length of its front and rear buffers.
-                d = vehicle.length * (
-                    1 + 2*SHARED.SETTINGS.length_buffer_factor)
+                d = vehicle.length_buffered
             elif transfer.section is VehicleSection.CENTER:
                 # Place the center vehicle section forward at half its length
                 # plus its rear buffer.
-                d = vehicle.length * (
-                    0.5 + SHARED.SETTINGS.length_buffer_factor)
+                d = vehicle.length_half_buffered
             else:  # transfer.section is VehicleSection.REAR
                 # Place the rear of the vehicle at the very end of the lane.
                 d = 0
@@ -688,13 +737,14 @@ class Lane(ABC):
 
         # Convert the real units distance d into proportional progress along
         # the lane trajectory and update the progress values.
-        new_vehicle_progress[transfer.section.value] = d/self.trajectory.length
-
-        return VehicleProgress(
-            front=new_vehicle_progress[0],
-            center=new_vehicle_progress[1],
-            rear=new_vehicle_progress[2]
-        )
+        p = d/self.trajectory_length
+        front, center, rear = old_progress
+        if transfer.section is VehicleSection.FRONT:
+            return VehicleProgress(p, center, rear)
+        elif transfer.section is VehicleSection.CENTER:
+            return VehicleProgress(front, p, rear)
+        else:  # transfer.section is VehicleSection.REAR
+            return VehicleProgress(front, center, p)
 
     def add_vehicle(self, vehicle: Vehicle) -> None:
         """Create entries for this vehicle in lane support structures."""
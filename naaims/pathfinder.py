@@ -37,6 +37,16 @@ class Pathfinder:
         # implementation.
         self.provided = provided
 
+        # Index the provided movements by Coord and then destination, so
+        # lookups don't need to build and hash a (Coord, int) pair each time.
+        self.provided_by_coord: Optional[Dict[Coord, Dict[int, List[Coord]]]
+                                         ] = None
+        if provided is not None:
+            self.provided_by_coord = {}
+            for (coord, destination), movements in provided.items():
+                self.provided_by_coord.setdefault(coord, {})[destination] = \
+                    movements
+
         # TODO: (low) Use the connectivity of each road to build a network that
         #       we can use with shortest path algorithms and infer destinations
 
@@ -64,12 +74,14 @@ class Pathfinder:
 
         # Bypass full routing check if the requested source-destination pair
         # has already been provided.
-        if self.provided is not None:
-            pair = (enters_intersection_at, destination)
-            if not at_least_one:
-                return self.provided.get(pair, [])
-            elif pair in self.provided:
-                return self.provided[pair]
+        if self.provided_by_coord is not None:
+            by_destination = self.provided_by_coord.get(enters_intersection_at)
+            movements = None if by_destination is None else \
+                by_destination.get(destination)
+            if movements is not None:
+                return movements
+            elif not at_least_one:
+                return []
 
         # TODO: Inferred destinations
         raise NotImplementedError("This source destination pair was not "
@@ -92,13 +92,14 @@ class RoadLane(Lane):
                                                              VehicleSection]:
         """Return if and what progress and section controls this Vehicle."""
 
-        front = self.vehicle_progress[vehicle].front
+        progress = self.vehicle_progress[vehicle]
+        front = progress.front
         if front is None:
             # The front of the vehicle is not on this road lane.
             if self.downstream_is_remover:
                 # There's a remover downstream so this road lane is still in
                 # control. Report the rear of the vehicle.
-                rear = self.vehicle_progress[vehicle].rear
+                rear = progress.rear
                 if rear is None:
                     raise RuntimeError("Vehicle exited lane already.")
                 else:
@@ -109,7 +110,7 @@ class RoadLane(Lane):
                 return False, float("inf"), VehicleSection.REAR
         else:
             # The front of this vehicle is on this road.
-            rear = self.vehicle_progress[vehicle].rear
+            rear = progress.rear
             if (rear is None) and (not self.upstream_is_spawner):
                 # The vehicles is still exiting the intersection and therefore
                 # not in this road lane's jurisdiction.
@@ -120,7 +121,8 @@ class RoadLane(Lane):
                 return True, front, VehicleSection.FRONT
 
     def accel_update(self, vehicle: Vehicle, section: VehicleSection, p: float,
-                     preceding: Optional[Vehicle]) -> float:
+                     preceding: Optional[Vehicle],
+                     effective_speed_limit: Optional[float] = None) -> float:
         """Return a vehicle's new acceleration.
 
         On top of the parent function's operations, adds additional cases to
@@ -141,24 +143,28 @@ class RoadLane(Lane):
         if self.downstream_is_remover:
             # No need to check for situations where you stop at the
             # intersection line because there is no intersection
-            return super().accel_update(vehicle=vehicle, section=section, p=p,
-                                        preceding=preceding)
+            return super().accel_update(
+                vehicle=vehicle, section=section, p=p, preceding=preceding,
+                effective_speed_limit=effective_speed_limit)
         else:
             # Need to make sure we stop at the intersection line if necessary
             if ((preceding is None) and
                     (not vehicle.permission_to_enter_intersection)):
                 # stop at the intersection line
-                return self.accel_update_following(vehicle, p)
+                return self.accel_update_following(
+                    vehicle, p, effective_speed_limit=effective_speed_limit)
 
-            a_follow = super().accel_update(vehicle=vehicle, section=section,
-                                            p=p, preceding=preceding)
+            a_follow = super().accel_update(
+                vehicle=vehicle, section=section, p=p, preceding=preceding,
+                effective_speed_limit=effective_speed_limit)
 
             if vehicle.permission_to_enter_intersection:
                 # Follow preceding vehicle into the intersection
                 return a_follow
             else:
                 # Stop for preceding vehicle AND intersection line
-                return min(a_follow, self.accel_update_following(vehicle, p))
+                return min(a_follow, self.accel_update_following(
+                    vehicle, p, effective_speed_limit=effective_speed_limit))
 
     # Support functions for stepping vehicles
 
@@ -174,7 +180,7 @@ class RoadLane(Lane):
             return None
         else:
             return self.downstream_intersection.\
-                stopping_distance_to_last_vehicle(self.trajectory.end_coord)
+                stopping_distance_to_last_vehicle(self.trajectory_end)
 
     def has_vehicle_exited(self, progress: VehicleProgress) -> bool:
         """Check if a vehicle has exited from road the lane.
@@ -218,14 +224,14 @@ class RoadLane(Lane):
             last = self.vehicles[-1]
             p = self.vehicle_progress[last].rear
             if p is not None:
-                to_return = p*self.trajectory.length
+                to_return = p*self.trajectory_length
             else:
                 return 0.
         else:
-            to_return = self.trajectory.length
+            to_return = self.trajectory_length
 
         if tight:
-            return min(to_return, self.entrance_end*self.trajectory.length)
+            return min(to_return, self.entrance_end*self.trajectory_length)
         else:
             return to_return
 
@@ -501,7 +507,7 @@ class RoadLane(Lane):
 
     def _x_to_intersection(self, progress: float) -> float:
         """Return the distance to the intersection given some progress."""
-        return (1-progress)*self.trajectory.length
+        return (1-progress)*self.trajectory_length
 
     @staticmethod
     def _x_in_intersection(v_guess: float, v_max: float, a: float,
@@ -826,10 +832,7 @@ class RoadLane(Lane):
         """Return a copy of the lane with vehicles and downstream removed."""
         # clone = super().clone()
         clone = copy(self)
-        clone.vehicles = []
-        clone.vehicle_progress = {}
-        clone.reservation_test_clone = True
-        clone.latest_scheduled_exit = None
+        clone.reset_for_requests()
         # TODO: (clarity) this implementation short circuits intended behavior
         #       by claiming that the cloned RoadLane doesn't end at an
         #       intersection regardless of if it actually does, so that it
@@ -839,3 +842,13 @@ class RoadLane(Lane):
         #       behavior; consider adding overrides to the constructor for this
         #       use case.
         return clone
+
+    def reset_for_requests(self) -> None:
+        """Clear the state a reservation test leaves on a cloned lane.
+
+        Used by clone() and to reuse a clone across reservation tests.
+        """
+        self.vehicles = []
+        self.vehicle_progress = {}
+        self.reservation_test_clone = True
+        self.latest_scheduled_exit = None
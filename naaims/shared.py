@@ -3,7 +3,8 @@ This module loads and shares setting options with all simulation sub-modules.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from itertools import count
 
 if TYPE_CHECKING:
     from naaims.pathfinder import Pathfinder
@@ -14,19 +15,44 @@ class Settings:
     not_read_error = RuntimeError("Shared settings not yet loaded.")
     pathfinder_created_error = RuntimeError("Pathfinder not yet created.")
 
+    # Settings are read on every vehicle update, so they're stored as plain
+    # slotted attributes instead of being guarded by properties. Reading one
+    # before load() falls through to __getattr__, which raises instead.
+    __slots__ = ('already_loaded', '__pathfinder_created', '__pathfinder',
+                 'steps_per_second', 'speed_limit', 'min_braking',
+                 'min_acceleration', 'length_buffer_factor',
+                 'max_stopping_distance', 'max_vehicle_length',
+                 'min_entrance_length', 'TIMESTEP_LENGTH')
+
+    # The settings fixed by load(). These can't change once loaded.
+    loaded_settings = frozenset(__slots__[3:])
+
     def __init__(self) -> None:
         self.already_loaded: bool = False
         self.__pathfinder_created: bool = False
         self.__pathfinder: Pathfinder
-        self.__steps_per_second: int
-        self.__speed_limit: int
-        self.__min_braking: float
-        self.__min_acceleration: float
-        self.__length_buffer_factor: float
-        self.__max_stopping_distance: float
-        self.__max_vehicle_length: float
-        self.__min_entrance_length: float
-        self.__timestep_length: float
+        self.steps_per_second: int
+        self.speed_limit: int
+        self.min_braking: float
+        self.min_acceleration: float
+        self.length_buffer_factor: float
+        self.max_stopping_distance: float
+        self.max_vehicle_length: float
+        self.min_entrance_length: float
+        self.TIMESTEP_LENGTH: float
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Freeze the loaded settings so they stay fixed for the simulation."""
+        if (name in Settings.loaded_settings) and self.already_loaded:
+            raise RuntimeError('Settings already loaded.')
+        super().__setattr__(name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        """Only called if a setting is read before it's been loaded."""
+        if name in Settings.__slots__:
+            raise Settings.not_read_error
+        raise AttributeError(
+            f"'Settings' object has no attribute '{name}'")
 
     @property
     def pathfinder(self) -> Pathfinder:
@@ -41,60 +67,6 @@ class Settings:
         self.__pathfinder = p
         self.__pathfinder_created = True
 
-    @property
-    def steps_per_second(self) -> int:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__steps_per_second
-
-    @property
-    def speed_limit(self) -> int:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__speed_limit
-
-    @property
-    def min_braking(self) -> float:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__min_braking
-
-    @property
-    def min_acceleration(self) -> float:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__min_acceleration
-
-    @property
-    def length_buffer_factor(self) -> float:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__length_buffer_factor
-
-    @property
-    def max_stopping_distance(self) -> float:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__max_stopping_distance
-
-    @property
-    def max_vehicle_length(self) -> float:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__max_vehicle_length
-
-    @property
-    def min_entrance_length(self) -> float:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__min_entrance_length
-
-    @property
-    def TIMESTEP_LENGTH(self) -> float:
-        if not self.already_loaded:
-            raise Settings.not_read_error
-        return self.__timestep_length
-
     def load(self,
              steps_per_second: int = 60,
              speed_limit: int = 15,
@@ -144,34 +116,34 @@ class Settings:
 
             if steps_per_second <= 0:
                 raise ValueError("steps_per_second must be greater than 0.")
-            self.__steps_per_second = steps_per_second
+            self.steps_per_second = steps_per_second
 
             if speed_limit <= 0:
                 raise ValueError("speed_limit must be greater than 0.")
-            self.__speed_limit = speed_limit
+            self.speed_limit = speed_limit
 
             if min_braking >= 0:
                 raise ValueError("min_braking must be negative.")
-            self.__min_braking = min_braking
+            self.min_braking = min_braking
 
             if min_acceleration <= 0:
                 raise ValueError("min_acceleration must be positive.")
-            self.__min_acceleration = min_acceleration
+            self.min_acceleration = min_acceleration
 
             if length_buffer_factor < 0:
                 raise ValueError("length_buffer_factor must be at least 0.")
-            self.__length_buffer_factor = length_buffer_factor
+            self.length_buffer_factor = length_buffer_factor
 
-            self.__max_stopping_distance = speed_limit**2/(2*-min_braking)
+            self.max_stopping_distance = speed_limit**2/(2*-min_braking)
 
             if max_vehicle_length <= 0:
                 raise ValueError("max_vehicle_length must be greater than 0.")
-            self.__max_vehicle_length = max_vehicle_length
+            self.max_vehicle_length = max_vehicle_length
 
-            self.__min_entrance_length = self.__max_stopping_distance + \
+            self.min_entrance_length = self.max_stopping_distance + \
                 max_vehicle_length
 
-            self.__timestep_length = steps_per_second**(-1)
+            self.TIMESTEP_LENGTH = steps_per_second**(-1)
 
             self.already_loaded = True
 
@@ -182,8 +154,8 @@ class Settings:
 SETTINGS: Settings = Settings()
 
 # shared vin counter
-# TODO: (parallel) Not thread safe. Fix for multiprocessing.
-vin_counter = 0
+# TODO: (parallel) Not process safe. Fix for multiprocessing.
+next_vin = count().__next__
 
 # Initialize global simulation timestep.
 t = 0
@@ -6,10 +6,12 @@ of the AIM simulator, including visualizations if enabled.
 from __future__ import annotations
 from typing import Generator, List, Tuple, Dict, Optional, Set, Any, Union
 from math import sin, cos
+from csv import writer as csv_writer
 
 from matplotlib.pyplot import subplots
 from matplotlib.patches import Rectangle, Polygon
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
 
 import naaims.shared as SHARED
 from naaims.util import Coord, SpeedUpdate
@@ -343,8 +345,9 @@ class Simulator:
             self.ax.patch.set_alpha(0)
             self.ax.set_aspect(1)
 
-            min_x = max_x = self.roads[0].trajectory.start_coord.x
-            min_y = max_y = self.roads[0].trajectory.start_coord.x
+            road_ends: List[Coord] = []
+            lane_markings: List[List[Tuple[float, float]]] = []
+            edge_markings: List[List[Tuple[float, float]]] = []
 
             # 6a. Loop through all roads and visualize their length, width,
             #     and lane markings, etc. using their trajectory.
@@ -354,82 +357,71 @@ class Simulator:
                 spacing = Coord(road.lane_width*sin(offset_angle)/2,
                                 road.lane_width*cos(offset_angle)/2)
 
-                # Plot lane markings
+                # Record lane markings
                 for lane in road.lanes[:-1]:
-                    coords: List[Coord] = [lane.trajectory.start_coord,
-                                           lane.trajectory.end_coord]
-                    self.ax.plot([c.x+spacing.x for c in coords],
-                                 [c.y+spacing.y for c in coords],
-                                 '--', c=lane_dash_color)
+                    start = lane.trajectory.start_coord
+                    end = lane.trajectory.end_coord
+                    lane_markings.append([(start.x+spacing.x,
+                                           start.y+spacing.y),
+                                          (end.x+spacing.x, end.y+spacing.y)])
 
-                # Plot road edge markings
+                # Record road edge markings
                 lane_first = road.lanes[0]
-                coords = [lane_first.trajectory.start_coord,
-                          lane_first.trajectory.end_coord]
-                top_xs = [c.x-spacing.x for c in coords]
-                top_ys = [c.y-spacing.y for c in coords]
-                self.ax.plot(top_xs, top_ys, c=road_sep_color)
+                top = [(c.x-spacing.x, c.y-spacing.y)
+                       for c in (lane_first.trajectory.start_coord,
+                                 lane_first.trajectory.end_coord)]
+                edge_markings.append(top)
                 lane_last = road.lanes[-1]
-                coords = [lane_last.trajectory.start_coord,
-                          lane_last.trajectory.end_coord]
-                bot_xs = [c.x+spacing.x for c in coords]
-                bot_ys = [c.y+spacing.y for c in coords]
-                self.ax.plot(bot_xs, bot_ys, c=road_sep_color)
+                bot = [(c.x+spacing.x, c.y+spacing.y)
+                       for c in (lane_last.trajectory.start_coord,
+                                 lane_last.trajectory.end_coord)]
+                edge_markings.append(bot)
 
                 # Fill in road
-                self.ax.add_patch(Polygon([[top_xs[0], top_ys[0]],
-                                           [top_xs[1], top_ys[1]],
-                                           [bot_xs[1], bot_ys[1]],
-                                           [bot_xs[0], bot_ys[0]]],
+                self.ax.add_patch(Polygon([top[0], top[1], bot[1], bot[0]],
                                           facecolor=road_color))
 
-                # Update all-plot bounds
-                coords = [road.trajectory.start_coord,
-                          road.trajectory.end_coord]
-                xs = [c.x for c in coords]
-                ys = [c.y for c in coords]
-                for x in xs:
-                    if min_x > x:
-                        min_x = x
-                    if max_x < x:
-                        max_x = x
-                for y in ys:
-                    if min_y > y:
-                        min_y = y
-                    if max_y < y:
-                        max_y = y
+                # Record road ends for the all-plot bounds
+                road_ends.append(road.trajectory.start_coord)
+                road_ends.append(road.trajectory.end_coord)
+
+            # Plot all lane and road edge markings, one artist for each kind.
+            self.ax.add_collection(LineCollection(
+                lane_markings, linestyles='--', colors=lane_dash_color))
+            self.ax.add_collection(LineCollection(
+                edge_markings, colors=road_sep_color))
 
             # 6b. Loop through all intersections and visualize their area.
             for intersection in self.intersections.values():
-                int_min_x = int_max_x = \
-                    intersection.lanes[0].trajectory.start_coord.x
-                int_min_y = int_max_y = \
-                    intersection.lanes[0].trajectory.start_coord.y
-                coords = []
+                xs: List[float] = []
+                ys: List[float] = []
                 for i_lane in intersection.lanes:
-                    coords.append(i_lane.trajectory.start_coord)
-                    coords.append(i_lane.trajectory.end_coord)
-                xs = [c.x for c in coords]
-                ys = [c.y for c in coords]
-                for x in xs:
-                    if int_min_x > x:
-                        int_min_x = x
-                    if int_max_x < x:
-                        int_max_x = x
-                for y in ys:
-                    if int_min_y > y:
-                        int_min_y = y
-                    if int_max_y < y:
-                        int_max_y = y
+                    start = i_lane.trajectory.start_coord
+                    end = i_lane.trajectory.end_coord
+                    xs += (start.x, end.x)
+                    ys += (start.y, end.y)
+                int_min_x = min(xs)
+                int_max_x = max(xs)
+                int_min_y = min(ys)
+                int_max_y = max(ys)
                 self.ax.add_patch(Rectangle((int_min_x, int_min_y),
                                             int_max_x-int_min_x,
                                             int_max_y-int_min_y,
                                             facecolor=road_color))
 
-            # 6c. Ready a list for all changing objects being plotted.
-            self.patches: List[Polygon] = []
-
-            # 6d. Place time on vis.
+            # 6c. Ready pools for all changing objects being plotted. Vehicle
+            #     patches persist for as long as the vehicle does and tile
+            #     patches are recycled between frames, so each frame only
+            #     moves existing patches instead of creating new ones. Unused
+            #     patches are hidden rather than removed from the axes so they
+            #     stay valid for blitting.
+            self.vehicle_patches: Dict[int, Polygon] = {}
+            self.spare_vehicle_patches: List[Polygon] = []
+            self.tile_patches: List[Polygon] = []
+
+            # 6d. Place time on vis, at the bottom left of the roads.
+            min_x = min(c.x for c in road_ends)
+            min_y = min(c.y for c in road_ends)
             self.time_text = self.ax.text(min_x, min_y,  # type: ignore
                                           self.strf_t(), fontsize=16)
 
@@ -441,6 +433,9 @@ class Simulator:
         #       tricky, but the algorithm is designed such that at most only
         #       one pass of the double for loop changes any one data structure.
 
+        # The timestep only advances at the very end of the step.
+        t = SHARED.t
+
         # 1. Have every facility (roads, intersections) calculate the speed and
         #    acceleration of its responsible vehicles. If a vehicle is in any
         #    part inside an intersection, the intersection calculates it,
@@ -450,9 +445,10 @@ class Simulator:
         for f in self.facilities:
             new_speeds.update(f.get_new_speeds())
         for vehicle in self.vehicles_in_scope:
-            update = new_speeds[vehicle]
-            vehicle.acceleration = update.acceleration
-            vehicle.velocity = update.velocity
+            # Acceleration goes first since its setter checks the old speed.
+            velocity, acceleration = new_speeds[vehicle]
+            vehicle.acceleration = acceleration
+            vehicle.velocity = velocity
 
         # 2. Have upstream objects (vehicle spawners, roads, and intersections)
         #    update vehicle absolute (Coord) and relative positions (in-lane
@@ -467,25 +463,21 @@ class Simulator:
                 spawned_vehicles, entering_vehicles = incoming_packet
                 assert type(u) is VehicleSpawner
                 for spawn in spawned_vehicles:
-                    self.vehicle_log[spawn.vin] = {}
-                    self.vehicle_log[spawn.vin]['t_spawn'] = SHARED.t
-                    self.vehicle_log[spawn.vin]['origin'] = u.id
-                    self.vehicle_log[spawn.vin][
-                        'destination_target'] = spawn.destination
-                    self.vehicle_log[spawn.vin]['width'] = spawn.width
-                    self.vehicle_log[spawn.vin]['length'] = spawn.length
-                    self.vehicle_log[spawn.vin][
-                        'throttle_mn'] = spawn.throttle_mn
-                    self.vehicle_log[spawn.vin][
-                        'throttle_sd'] = spawn.throttle_sd
-                    self.vehicle_log[spawn.vin][
-                        'tracking_mn'] = spawn.tracking_mn
-                    self.vehicle_log[spawn.vin][
-                        'tracking_sd'] = spawn.tracking_sd
-                    self.vehicle_log[spawn.vin]['vot'] = spawn.vot
-                    self.vehicle_log[spawn.vin]['type'] = type(spawn).__name__
+                    self.vehicle_log[spawn.vin] = {
+                        't_spawn': t,
+                        'origin': u.id,
+                        'destination_target': spawn.destination,
+                        'width': spawn.width,
+                        'length': spawn.length,
+                        'throttle_mn': spawn.throttle_mn,
+                        'throttle_sd': spawn.throttle_sd,
+                        'tracking_mn': spawn.tracking_mn,
+                        'tracking_sd': spawn.tracking_sd,
+                        'vot': spawn.vot,
+                        'type': type(spawn).__name__
+                    }
                 for entering in entering_vehicles:
-                    self.vehicle_log[entering.vin]['t_entry'] = SHARED.t
+                    self.vehicle_log[entering.vin]['t_entry'] = t
                 self.vehicles_in_scope.update(entering_vehicles)
 
         # 3. Have every downstream object (roads, intersections, and vehicle
@@ -498,14 +490,14 @@ class Simulator:
             # in this cycle
             if exiting_vehicles is not None:
                 for exiting in exiting_vehicles:
-                    self.vehicle_log[exiting.vin]['t_exit'] = SHARED.t
+                    self.vehicle_log[exiting.vin]['t_exit'] = t
                     # TODO: (multiple) determine if a vehicle successfully
                     #       reached its destination. Will require adding an ID
                     #       property to VehicleRemovers.
                     self.vehicle_log[exiting.vin]['payment'] = exiting.payment
 
-                    # remove it from our tracker
-                    self.vehicles_in_scope.remove(exiting)
+                # remove them from our tracker
+                self.vehicles_in_scope.difference_update(exiting_vehicles)
 
         # 4. Have facility managers handle their special internal logic (e.g.,
         #    lane changes and reservations).
@@ -513,7 +505,7 @@ class Simulator:
             f.update_schedule(self.visualize_tiles)
 
         # 5. Update shared time step and (TODO: (low)) shortest path values
-        SHARED.t += 1
+        SHARED.t = t + 1
         SHARED.SETTINGS.pathfinder.update(None)
 
     def save_log(self, filename: str) -> None:
@@ -539,26 +531,32 @@ class Simulator:
             14. payment collected from this vehicle (by auction managers)
             15. vehicle type/class
         """
-        with open(filename, 'w') as f:
-            f.write("t_spawn,t_entry,t_exit,origin,destination_target,"
-                    "destination_actual,width,length,throttle_mn,throttle_sd,"
-                    "tracking_mn,tracking_sd,vot,payment,type\n")
-            for _, vehicle_log in sorted(self.vehicle_log.items()):
-                f.write(f'{vehicle_log["t_spawn"]},'
-                        f'{vehicle_log.get("t_entry", -1)},'
-                        f'{vehicle_log.get("t_exit", -1)},'
-                        f'{vehicle_log["origin"]},'
-                        f'{vehicle_log["destination_target"]},'
-                        f'{vehicle_log.get("destination_actual", -1)},'
-                        f'{vehicle_log["width"]},'
-                        f'{vehicle_log["length"]},'
-                        f'{vehicle_log["throttle_mn"]},'
-                        f'{vehicle_log["throttle_sd"]},'
-                        f'{vehicle_log["tracking_mn"]},'
-                        f'{vehicle_log["tracking_sd"]},'
-                        f'{vehicle_log["vot"]},'
-                        f'{vehicle_log.get("payment", -1)},'
-                        f'{vehicle_log["type"]},\n')
+        with open(filename, 'w', newline='') as f:
+            # Rows end in an empty field to match the trailing comma of the
+            # original format.
+            writer = csv_writer(f, lineterminator='\n')
+            writer.writerow(("t_spawn", "t_entry", "t_exit", "origin",
+                             "destination_target", "destination_actual",
+                             "width", "length", "throttle_mn", "throttle_sd",
+                             "tracking_mn", "tracking_sd", "vot", "payment",
+                             "type"))
+            writer.writerows((log["t_spawn"],
+                              log.get("t_entry", -1),
+                              log.get("t_exit", -1),
+                              log["origin"],
+                              log["destination_target"],
+                              log.get("destination_actual", -1),
+                              log["width"],
+                              log["length"],
+                              log["throttle_mn"],
+                              log["throttle_sd"],
+                              log["tracking_mn"],
+                              log["tracking_sd"],
+                              log["vot"],
+                              log.get("payment", -1),
+                              log["type"],
+                              '')
+                             for _, log in sorted(self.vehicle_log.items()))
 
     def animate(self, frame_ratio: int = 1, max_timestep: int = 10*60
                 ) -> FuncAnimation:  # type: ignore
@@ -578,13 +576,10 @@ class Simulator:
             vehicles: Set[Vehicle] = packet[0]
             intersections: Tuple[Intersection, ...] = packet[1]
 
-            # Prepare to remove last timestep's patches.
-            changed = self.patches.copy()
-            for patch in self.patches:
-                patch.remove()
-            self.patches = []
+            changed: List[Polygon] = []
 
-            # Prepare new vehicle patches
+            # Update vehicle patches, creating them for new vehicles.
+            vehicle_patches: Dict[int, Polygon] = {}
             for vehicle in vehicles:
                 vehicle_color: str
                 if vehicle.has_reservation:
@@ -593,26 +588,59 @@ class Simulator:
                     vehicle_color = self.permitted_color
                 else:
                     vehicle_color = self.vehicle_color
-                patch = Polygon(
-                    vehicle.get_outline(), facecolor=vehicle_color, alpha=1,
-                    edgecolor=self.human_vehicle_outline_color if
-                    (type(vehicle) is HumanGuidedVehicle) else None,
-                    zorder=5)
-                self.ax.add_patch(patch)
-                self.patches.append(patch)
+                outline = vehicle.get_outline()
+                patch = self.vehicle_patches.pop(vehicle.vin, None)
+                if patch is None:
+                    edge_color = self.human_vehicle_outline_color if \
+                        (type(vehicle) is HumanGuidedVehicle) else None
+                    if len(self.spare_vehicle_patches) > 0:
+                        patch = self.spare_vehicle_patches.pop()
+                        patch.set_xy(outline)
+                        patch.set_facecolor(vehicle_color)
+                        patch.set_edgecolor(edge_color)
+                        patch.set_visible(True)
+                    else:
+                        patch = Polygon(
+                            outline, facecolor=vehicle_color, alpha=1,
+                            edgecolor=edge_color, zorder=5)
+                        self.ax.add_patch(patch)
+                else:
+                    patch.set_xy(outline)
+                    patch.set_facecolor(vehicle_color)
+                vehicle_patches[vehicle.vin] = patch
+                changed.append(patch)
+
+            # Hide the patches of vehicles that have left for reuse.
+            for patch in self.vehicle_patches.values():
+                patch.set_visible(False)
+                self.spare_vehicle_patches.append(patch)
                 changed.append(patch)
+            self.vehicle_patches = vehicle_patches
 
-            # Prepare new tile patches
+            # Update tile patches, reusing last frame's where possible.
+            i = 0
             for intersection in intersections:
                 if intersection.tiles_to_visualize is not None:
                     for outline, p, n in intersection.tiles_to_visualize:
                         n = 3 if (n > 3) else n
-                        patch = Polygon(
-                            outline, facecolor=self.tile_color[n],
-                            alpha=(p**.2)/2, edgecolor=None, zorder=4)
-                        self.ax.add_patch(patch)
-                        self.patches.append(patch)
+                        if i < len(self.tile_patches):
+                            patch = self.tile_patches[i]
+                            patch.set_xy(outline)
+                            patch.set_facecolor(self.tile_color[n])
+                            patch.set_alpha((p**.2)/2)
+                            patch.set_visible(True)
+                        else:
+                            patch = Polygon(
+                                outline, facecolor=self.tile_color[n],
+                                alpha=(p**.2)/2, edgecolor=None, zorder=4)
+                            self.ax.add_patch(patch)
+                            self.tile_patches.append(patch)
                         changed.append(patch)
+                        i += 1
+            for patch in self.tile_patches[i:]:
+                if patch.get_visible():
+                    patch.set_visible(False)
+                    changed.append(patch)
 
             # Update time
             self.time_text.set_text(self.strf_t())
@@ -636,9 +664,7 @@ class Simulator:
 
     def strf_t(self) -> str:
         """Return the current timestep as a nicely formatted time string."""
-        time = SHARED.t * SHARED.SETTINGS.TIMESTEP_LENGTH
-        min = time//60
-        sec = time % 60
+        min, sec = divmod(SHARED.t * SHARED.SETTINGS.TIMESTEP_LENGTH, 60)
         return f'{min:02.0f}:{sec:06.3f}'
 
     @staticmethod
@@ -303,28 +303,23 @@ class Vehicle(Configurable):
         if static_buffer < 0:
             raise ValueError("Static buffer must be nonnegative.")
 
-        # Heading is the angle of the front of the car
+        # Heading is the angle of the front of the car. These are the same
+        # corrections as scaling vector_forward and vector_right, inlined
+        # since this runs for every vehicle on every tiling check and frame.
+        heading = self.heading
+        scale = 1+static_buffer
         # Length vector from center to car front
-        forward_vector = self.vector_forward()
-        length_correction = Coord(forward_vector.x*(1+static_buffer),
-                                  forward_vector.y*(1+static_buffer))
+        lx = cos(heading)*self.length/2*scale
+        ly = sin(heading)*self.length/2*scale
         # Width vector from center to car right
-        right_vector = self.vector_right()
-        width_correction = Coord(right_vector.x*(1+static_buffer),
-                                 right_vector.y*(1+static_buffer))
-        return (Coord(
-            self.pos.x + length_correction.x - width_correction.x,
-            self.pos.y + length_correction.y - width_correction.y
-        ), Coord(
-            self.pos.x + length_correction.x + width_correction.x,
-            self.pos.y + length_correction.y + width_correction.y
-        ), Coord(
-            self.pos.x - length_correction.x + width_correction.x,
-            self.pos.y - length_correction.y + width_correction.y
-        ), Coord(
-            self.pos.x - length_correction.x - width_correction.x,
-            self.pos.y - length_correction.y - width_correction.y
-        ))
+        wx = cos(heading-pi/2)*self.width/2*scale
+        wy = sin(heading-pi/2)*self.width/2*scale
+        x = self.pos.x
+        y = self.pos.y
+        return (Coord(x + lx - wx, y + ly - wy),
+                Coord(x + lx + wx, y + ly + wy),
+                Coord(x - lx + wx, y - ly + wy),
+                Coord(x - lx - wx, y - ly - wy))
 
     def vector_forward(self) -> Coord:
         """Return the vector of the car's front half as a relative Coord.
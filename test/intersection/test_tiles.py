@@ -1,7 +1,7 @@
 from pytest import raises
 
 from naaims.intersection.tilings.tiles import (Tile, DeterministicTile,
-                                               StochasticTile)
+                                               StochasticTile, TileLayer)
 from naaims.intersection.reservation import Reservation
 from naaims.vehicles import Vehicle
 from naaims.util import Coord, VehicleSection
@@ -103,3 +103,27 @@ def test_potential_reservation(load_shared: None, vehicle: Vehicle,
     assert tile.will_reservation_work(res2)
     tile.confirm(res3)
     assert res3 in tile.reserved_by
+
+
+def test_tile_layer():
+    layer = TileLayer(DeterministicTile, 3, 10, threshold=.5)
+    assert len(layer) == 10
+    assert len(layer.materialized) == 0
+
+    tile = layer[4]
+    assert isinstance(tile, DeterministicTile)
+    assert hash(tile) == hash((4, 3))
+    assert tile.threshold == .5
+    assert layer[4] is tile
+    assert len(layer.materialized) == 1
+
+    row = layer[3:6]
+    assert len(row) == 3
+    assert row[1] is tile
+    assert len(layer.materialized) == 3
+
+    with raises(IndexError):
+        layer[10]
+
+    assert len(list(layer)) == 10
+    assert len(layer.materialized) == 10
@@ -703,7 +703,7 @@ def test_new_layer(load_shared: None, sq_stochastic: SquareTiling):
 
     # Mock next timestep
     SHARED.t += 1
-    sq_stochastic.tiles.pop(0)
+    sq_stochastic.tiles.popleft()
     assert len(sq_stochastic.tiles) == 1
     assert hash(sq_stochastic.tiles[0][22]) == hash((22, 2))
     sq_stochastic._add_new_layer()
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional, OrderedDict, Tuple
 from math import ceil, floor
 
-from pytest import raises, fixture, approx
+from pytest import raises, fixture, approx, MonkeyPatch
 
 from naaims.util import VehicleSection, Coord
 from naaims.trajectories import BezierTrajectory
@@ -1326,6 +1326,36 @@ def test_check_req_ok(clean_request: Tuple[
     assert cycle_res[0] == next(iter(valid_reservations.values()))
 
 
+def test_check_req_reused_clones(clean_request: Tuple[
+        Tiling, RoadLane, OrderedDict[Vehicle, Reservation], Reservation]):
+    sq, irl_og, _, _ = clean_request
+
+    def summary(res: Optional[Tuple[Reservation, int]]):
+        assert res is not None
+        return (res[1], res[0].tiles, res[0].entrance_front,
+                res[0].entrance_rear, res[0].exit_rear)
+
+    first = summary(sq.check_request(irl_og))
+
+    # Leave stray state on the reused clone, as an earlier test could.
+    clone = sq.road_lane_test_clones[irl_og]
+    vehicle = irl_og.vehicles[1]
+    clone.vehicles = [vehicle]
+    clone.vehicle_progress = {vehicle: VehicleProgress(.5, .4, .3)}
+    clone.latest_scheduled_exit = ScheduledExit(
+        vehicle, VehicleSection.REAR, SHARED.t + 1000, 0)
+
+    second = summary(sq.check_request(irl_og))
+    assert sq.road_lane_test_clones[irl_og] is clone
+    assert len(clone.vehicles) == 0
+    assert len(clone.vehicle_progress) == 0
+    assert clone.latest_scheduled_exit is None
+
+    sq.road_lane_test_clones.clear()
+    fresh = summary(sq.check_request(irl_og))
+    assert first == second == fresh
+
+
 def request_timeout_option(timeout: bool, p_back: float = .9) -> Tuple[
         Tiling, RoadLane, OrderedDict[Vehicle, Reservation], Reservation]:
     sq = square_tiling(0, 100, 0, 200, 1, 30, timeout=timeout)
@@ -1468,3 +1498,72 @@ def test_timeout_short_counterfactual(request_without_timeout_short: Tuple[
         Tiling, RoadLane, OrderedDict[Vehicle, Reservation], Reservation]):
     timeout_test_pattern(request_without_timeout_short,
                          p_back=.99, timeout=False)
+
+
+def test_timeout_purge(request_with_timeout: Tuple[
+        Tiling, RoadLane, OrderedDict[Vehicle, Reservation], Reservation]):
+    sq, irl_og, valid_reservations, _ = request_with_timeout
+    vehicle = next(iter(valid_reservations.values())).vehicle
+    assert sq.timeout_until is not None
+
+    # Log the same timeout twice so the heap has to break a tie.
+    assert sq.check_request(irl_og) is None
+    expiry = sq.timeout_until[vehicle]
+    del sq.timeout_until[vehicle]
+    assert sq.check_request(irl_og) is None
+    assert sq.timeout_until[vehicle] == expiry
+    assert len(sq.timeout_heap) == 2
+
+    # Timeouts stay until they expire.
+    SHARED.t = expiry - 1
+    sq.handle_new_timestep()
+    assert sq.timeout_until[vehicle] == expiry
+    assert len(sq.timeout_heap) == 2
+
+    SHARED.t = expiry
+    sq.handle_new_timestep()
+    assert vehicle not in sq.timeout_until
+    assert len(sq.timeout_heap) == 0
+
+
+def test_check_req_stall(load_shared_clean: None, monkeypatch: MonkeyPatch):
+    sq = square_tiling(0, 100, 0, 200, 1, 30)
+    il = sq.lanes[0]
+    irl = sq.incoming_road_lane_by_coord[il.trajectory.start_coord]
+    SHARED.SETTINGS.pathfinder = Pathfinder([], [], {
+        (il.trajectory.start_coord, 0): [il.trajectory.end_coord]})
+
+    # Queue two stopped vehicles at the front of the incoming lane.
+    vehicle: Vehicle = AutomatedVehicle(0, 0)
+    vehicle2: Vehicle = AutomatedVehicle(1, 0)
+    p_length = vehicle.length * (1+2*SHARED.SETTINGS.length_buffer_factor) \
+        / irl.trajectory.length
+    irl.vehicles = [vehicle, vehicle2]
+    for v, front in ((vehicle, .99), (vehicle2, .98 - p_length)):
+        irl.vehicle_progress[v] = VehicleProgress(front, front - p_length/2,
+                                                  front - p_length)
+        v.velocity = 0
+        v.acceleration = 0
+        v.pos = irl.trajectory.get_position(front - p_length/2)
+        v.heading = irl.trajectory.get_heading(front - p_length/2)
+
+    # Without a stall, both vehicles make it through.
+    full = sq.check_request(irl, sequence=True)
+    assert full is not None
+    leader = full[0]
+    follower = leader.dependency
+    assert follower is not None
+    assert (leader.exit_rear is not None) and (follower.exit_rear is not None)
+    assert leader.exit_rear.t < follower.exit_rear.t
+
+    # Bound the test so it stalls after the leader exits but before the
+    # follower does.
+    t_stall = (leader.exit_rear.t + follower.exit_rear.t)//2
+    bound = t_stall - leader.entrance_front.t
+    monkeypatch.setattr(Tiling, '_test_timesteps_bound',
+                        staticmethod(lambda *_: bound))
+    stalled = sq.check_request(irl, sequence=True)
+    assert stalled is not None
+    assert stalled[0].vehicle is vehicle
+    assert stalled[0].exit_rear == leader.exit_rear
+    assert stalled[0].dependency is None
@@ -504,6 +504,24 @@ def test_progress_update(rl: RoadLane, vehicle: AutomatedVehicle):
     assert p_rear == -1
 
 
+def test_progress_update_new_trajectory(rl: RoadLane,
+                                        vehicle: AutomatedVehicle):
+    rl.trajectory = BezierTrajectory(Coord(0, 0), Coord(500, 0),
+                                     [Coord(250, 0)])
+    assert rl.trajectory_length == rl.trajectory.length == 500
+    assert rl.trajectory_end == Coord(500, 0)
+
+    vehicle.velocity = rl.speed_limit
+    distance_in_1t = (rl.speed_limit * SHARED.SETTINGS.TIMESTEP_LENGTH)
+    p_in_1t = distance_in_1t / 500
+
+    p_new, _, transfers = rl.update_vehicle_progress(
+        vehicle, VehicleProgress(1, .5, .5))
+    assert p_new.center == p_new.rear == .5 + p_in_1t
+    assert len(transfers) == 1
+    assert transfers[0].pos == Coord(500, 0)
+
+
 def test_pos_update(rl: RoadLane, vehicle: AutomatedVehicle):
     rl.update_vehicle_position(vehicle, .5)
     assert vehicle.pos == Coord(500, 0)
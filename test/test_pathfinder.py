@@ -41,3 +41,25 @@ def test_hardcoded_pathfinder_options():
 
     assert p.next_movements(enters_intersection_at=lane_il,
                             destination=destination_r) == [lane_or]
+
+
+def test_hardcoded_pathfinder_missing():
+
+    lane_il = Coord(0, 12)
+    lane_iu = Coord(12, 0)
+    lane_ou = Coord(12, 24)
+    destination_u = 0
+    destination_r = 1
+
+    p = Pathfinder([], [], {(lane_il, destination_u): [lane_ou]})
+
+    assert p.next_movements(enters_intersection_at=lane_il,
+                            destination=destination_r) == []
+    assert p.next_movements(enters_intersection_at=lane_iu,
+                            destination=destination_u) == []
+    assert p.next_movements(enters_intersection_at=lane_il,
+                            destination=destination_u,
+                            at_least_one=True) == [lane_ou]
+    with raises(NotImplementedError):
+        p.next_movements(enters_intersection_at=lane_iu,
+                         destination=destination_u, at_least_one=True)